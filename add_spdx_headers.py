@@ -6,9 +6,15 @@
 Script to add SPDX license identifiers to all Python source files.
 """
 
+import argparse
+import concurrent.futures
+import mmap
 import os
+import queue
+import shutil
+import threading
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, Iterator, Optional, Set, Tuple
 
 # License mapping based on directory
 LICENSE_MAP = {
@@ -22,35 +28,88 @@ LICENSE_MAP = {
     '': 'Apache-2.0',  # Root directory
 }
 
+DEFAULT_LICENSE = 'Apache-2.0'
+
+# Path trie compiled from LICENSE_MAP: top-level directory -> second-level
+# directory -> license. A '_' entry applies to the whole top-level directory.
+LICENSE_TRIE: Dict[str, Dict[str, str]] = {}
+for _prefix, _license_id in LICENSE_MAP.items():
+    if _prefix:
+        _top, _, _rest = _prefix.rstrip('/').partition('/')
+        LICENSE_TRIE.setdefault(_top, {})[_rest or '_'] = _license_id
+
 COPYRIGHT_LINE = "# Copyright (C) 2024-2026 The Birthmark Standard Foundation"
 
+# The SPDX header must appear within the first SPDX_HEAD_SIZE bytes of a file
+SPDX_MARKER = 'SPDX-License-Identifier:'
+SPDX_HEAD_SIZE = 512
+SPDX_MARKER_BYTES = SPDX_MARKER.encode('ascii')
+
+# Directories never descended into (hidden directories are skipped as well)
+EXCLUDED_DIRS = frozenset({'venv', 'env', '__pycache__', 'node_modules'})
+
+
+def iter_py_files(root: str) -> Iterator[str]:
+    """
+    Yield paths of Python files under root.
 
-def get_license_for_file(file_path: Path, repo_root: Path) -> str:
-    """Determine which license applies to a file based on its path."""
-    relative_path = file_path.relative_to(repo_root)
-    path_str = str(relative_path)
+    Excluded and hidden directories are pruned before descent, so large
+    virtualenvs or node_modules trees are never listed.
+    """
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name.startswith('.') or entry.name in EXCLUDED_DIRS:
+                        continue
+                    stack.append(entry.path)
+                elif entry.name.endswith('.py'):
+                    yield entry.path
+
+
+def get_license_for_file(path_str: str) -> str:
+    """
+    Determine which license applies to a file based on its path.
 
-    # Check each license mapping
-    for prefix, license_id in LICENSE_MAP.items():
-        if prefix == '':
-            # Root directory - only match files directly in root
-            if '/' not in path_str:
-                return license_id
-        elif path_str.startswith(prefix):
-            return license_id
+    Args:
+        path_str: Path relative to the repository root, using '/' separators
+    """
+    parts = path_str.split('/', 2)
+    if len(parts) == 1:
+        # Root directory - only match files directly in root
+        return LICENSE_MAP['']
 
-    # Default to Apache-2.0
-    return 'Apache-2.0'
+    node = LICENSE_TRIE.get(parts[0])
+    if node is None:
+        return DEFAULT_LICENSE
 
+    # parts[1] is only a directory when something follows it
+    if len(parts) > 2 and parts[1] in node:
+        return node[parts[1]]
+    return node.get('_', DEFAULT_LICENSE)
 
-def has_spdx_identifier(content: str) -> bool:
-    """Check if file already has SPDX identifier."""
-    lines = content.split('\n')
-    # Check first 5 lines for SPDX
-    for line in lines[:5]:
-        if 'SPDX-License-Identifier:' in line:
-            return True
-    return False
+
+def relative_path_str(file_path_str: str, root_prefix: str) -> str:
+    """Strip root_prefix (repo root plus trailing separator) from a path."""
+    path_str = file_path_str[len(root_prefix):]
+    if os.sep != '/':
+        path_str = path_str.replace(os.sep, '/')
+    return path_str
+
+
+def file_has_spdx_identifier(file_path: str) -> bool:
+    """
+    Check a file on disk for an SPDX identifier without reading it into memory.
+
+    The file is memory-mapped so only the pages touched by the search are
+    paged in and no intermediate bytes object is allocated.
+    """
+    with open(file_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return False  # mmap cannot map empty files
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return mm.find(SPDX_MARKER_BYTES, 0, SPDX_HEAD_SIZE) != -1
 
 
 def add_spdx_header(content: str, license_id: str) -> str:
@@ -71,79 +130,156 @@ def add_spdx_header(content: str, license_id: str) -> str:
     return '\n'.join(new_lines)
 
 
-def process_file(file_path: Path, repo_root: Path, dry_run: bool = False) -> Tuple[bool, str]:
+class FileWriter:
+    """
+    Single background thread that performs all file writes.
+
+    Workers hand finished content to the writer instead of writing it
+    themselves, so they never block on write/close syscalls. Each file is
+    written to a temporary sibling and moved into place with os.replace, so
+    an interrupted run never leaves a truncated source file behind.
+    """
+
+    def __init__(self):
+        self.queue: "queue.Queue[Optional[Tuple[str, str]]]" = queue.Queue()
+        self.failed: Set[str] = set()
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+
+    def write(self, file_path_str: str, content: str) -> None:
+        """Queue content to be written to file_path_str."""
+        self.queue.put((file_path_str, content))
+
+    def close(self) -> None:
+        """Flush all queued writes and stop the writer thread."""
+        self.queue.put(None)
+        self.thread.join()
+
+    def _run(self) -> None:
+        while True:
+            item = self.queue.get()
+            if item is None:
+                return
+
+            file_path_str, content = item
+            tmp_path = file_path_str + '.tmp'
+            try:
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    f.write(content)
+                shutil.copymode(file_path_str, tmp_path)  # Keep executable bits
+                os.replace(tmp_path, file_path_str)
+            except Exception as e:
+                print(f"Error writing {file_path_str}: {e}")
+                self.failed.add(file_path_str)
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+
+
+def process_file(file_path_str: str, root_prefix: str) -> Tuple[Optional[str], str]:
     """
     Process a single Python file.
 
+    Takes plain strings rather than Path objects so it can be submitted to a
+    ProcessPoolExecutor. The file is not written here; the caller passes the
+    new content to a FileWriter.
+
+    Args:
+        file_path_str: Path to the file
+        root_prefix: Repository root followed by os.sep
+
     Returns:
-        (modified: bool, license_id: str)
+        (new_content: str or None if no change is needed, license_id: str)
     """
+    license_id = get_license_for_file(relative_path_str(file_path_str, root_prefix))
+
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
+        # Check if already has SPDX; most files do, so avoid reading them
+        if file_has_spdx_identifier(file_path_str):
+            return None, license_id
+
+        with open(file_path_str, 'r', encoding='utf-8') as f:
             content = f.read()
     except Exception as e:
-        print(f"Error reading {file_path}: {e}")
-        return False, "error"
-
-    # Check if already has SPDX
-    if has_spdx_identifier(content):
-        license_id = get_license_for_file(file_path, repo_root)
-        return False, license_id
-
-    # Determine license
-    license_id = get_license_for_file(file_path, repo_root)
+        print(f"Error reading {file_path_str}: {e}")
+        return None, "error"
 
     # Add header
-    new_content = add_spdx_header(content, license_id)
-
-    if not dry_run:
-        try:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(new_content)
-        except Exception as e:
-            print(f"Error writing {file_path}: {e}")
-            return False, "error"
-
-    return True, license_id
+    return add_spdx_header(content, license_id), license_id
 
 
 def main():
-    repo_root = Path('/home/user/Birthmark')
-
-    # Find all Python files
-    python_files = list(repo_root.rglob('*.py'))
+    parser = argparse.ArgumentParser(description="Add SPDX headers to Python files")
+    parser.add_argument(
+        '--threads',
+        action='store_true',
+        help="Use threads instead of processes (for I/O-bound runs, e.g. network filesystems)",
+    )
+    parser.add_argument(
+        '--dry-run',
+        action='store_true',
+        help="Report files that would be modified without writing them",
+    )
+    args = parser.parse_args()
 
-    # Exclude venv, .git, etc.
-    python_files = [
-        f for f in python_files
-        if not any(part.startswith('.') or part in ['venv', 'env', '__pycache__', 'node_modules']
-                   for part in f.parts)
-    ]
+    repo_root = Path('/home/user/Birthmark')
+    root_prefix = str(repo_root) + os.sep
 
     # Statistics
     stats: Dict[str, Dict[str, int]] = {
-        'AGPL-3.0-or-later': {'modified': 0, 'skipped': 0},
-        'Apache-2.0': {'modified': 0, 'skipped': 0},
+        'AGPL-3.0-or-later': {'modified': 0, 'would_add': 0, 'skipped': 0},
+        'Apache-2.0': {'modified': 0, 'would_add': 0, 'skipped': 0},
     }
 
-    modified_files: List[Path] = []
+    modified_files: Dict[str, str] = {}  # path -> license_id
 
-    print(f"Processing {len(python_files)} Python files...")
+    print(f"Processing Python files under {repo_root}...")
     print()
 
-    for file_path in sorted(python_files):
-        modified, license_id = process_file(file_path, repo_root, dry_run=False)
-
-        if license_id == "error":
+    executor_cls = (
+        concurrent.futures.ThreadPoolExecutor if args.threads
+        else concurrent.futures.ProcessPoolExecutor
+    )
+    writer = None if args.dry_run else FileWriter()
+
+    # Files are submitted while the walk is still running so scanning and
+    # processing overlap; stats are aggregated here in the parent
+    with executor_cls() as executor:
+        futures = {
+            executor.submit(process_file, path, root_prefix): path
+            for path in iter_py_files(str(repo_root))
+        }
+
+        for future in concurrent.futures.as_completed(futures):
+            file_path = futures[future]
+            new_content, license_id = future.result()
+
+            if license_id == "error":
+                continue
+
+            if new_content is not None:
+                modified_files[file_path] = license_id
+                if writer:
+                    writer.write(file_path, new_content)
+            else:
+                stats[license_id]['skipped'] += 1
+
+    failed: Set[str] = set()
+    if writer:
+        writer.close()
+        failed = writer.failed
+
+    for file_path in sorted(modified_files):
+        if file_path in failed:
             continue
-
-        if modified:
+        license_id = modified_files[file_path]
+        relative_path = relative_path_str(file_path, root_prefix)
+        if args.dry_run:
+            # Nothing was written, so these are not counted as modified
+            stats[license_id]['would_add'] += 1
+            print(f"Would add {license_id}: {relative_path}")
+        else:
             stats[license_id]['modified'] += 1
-            modified_files.append(file_path)
-            relative_path = file_path.relative_to(repo_root)
             print(f"✓ Added {license_id}: {relative_path}")
-        else:
-            stats[license_id]['skipped'] += 1
 
     # Print summary
     print()
@@ -154,20 +290,28 @@ def main():
 
     for license_id in ['AGPL-3.0-or-later', 'Apache-2.0']:
         modified = stats[license_id]['modified']
+        would_add = stats[license_id]['would_add']
         skipped = stats[license_id]['skipped']
-        total = modified + skipped
+        total = modified + would_add + skipped
         print(f"{license_id}:")
-        print(f"  Modified: {modified}")
+        if args.dry_run:
+            print(f"  Would modify: {would_add}")
+        else:
+            print(f"  Modified: {modified}")
         print(f"  Already had SPDX: {skipped}")
         print(f"  Total: {total}")
         print()
 
     total_modified = sum(s['modified'] for s in stats.values())
-    total_files = len(python_files)
+    total_would_add = sum(s['would_add'] for s in stats.values())
+    total_files = len(futures)
 
     print(f"Total files processed: {total_files}")
-    print(f"Total files modified: {total_modified}")
-    print(f"Total files skipped: {total_files - total_modified}")
+    if args.dry_run:
+        print(f"Total files that would be modified: {total_would_add}")
+    else:
+        print(f"Total files modified: {total_modified}")
+    print(f"Total files skipped: {total_files - total_modified - total_would_add}")
 
 
 if __name__ == '__main__':
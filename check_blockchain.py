@@ -7,17 +7,24 @@ Check Birthmark blockchain status and recent blocks.
 """
 
 import requests
-import json
+
+try:
+    from orjson import loads as json_loads
+except ImportError:  # orjson is optional; stdlib json also accepts bytes
+    from json import loads as json_loads
+
+# Shared session so both queries reuse one keep-alive connection
+_SESSION = requests.Session()
 
 def check_status():
     """Query blockchain status."""
     url = "http://localhost:8545/api/v1/blockchain/status"
 
     try:
-        response = requests.get(url, timeout=5)
+        response = _SESSION.get(url, timeout=5)
 
         if response.status_code == 200:
-            status = response.json()
+            status = json_loads(response.content)
 
             print("=" * 60)
             print("BIRTHMARK BLOCKCHAIN STATUS")
@@ -55,10 +62,10 @@ def get_recent_blocks():
     url = "http://localhost:8545/api/v1/blockchain/blocks/recent"
 
     try:
-        response = requests.get(url, timeout=5)
+        response = _SESSION.get(url, timeout=5)
 
         if response.status_code == 200:
-            blocks = response.json().get('blocks', [])
+            blocks = json_loads(response.content).get('blocks', [])
 
             if blocks:
                 print("\n" + "=" * 60)
@@ -82,5 +89,8 @@ def get_recent_blocks():
 
 
 if __name__ == "__main__":
-    if check_status():
-        get_recent_blocks()
+    try:
+        if check_status():
+            get_recent_blocks()
+    finally:
+        _SESSION.close()
@@ -0,0 +1,34 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# Copyright (C) 2024-2026 The Birthmark Standard Foundation
+
+"""Add partial index for the validation worker queue
+
+Revision ID: add_validation_queue_index
+Revises: add_validation_retry
+Create Date: 2026-10-17
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_validation_queue_index'
+down_revision = 'add_validation_retry'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Index pending submissions by arrival time, restricted to the queue."""
+    op.create_index(
+        'idx_pending_validation_queue',
+        'pending_submissions',
+        ['received_at'],
+        postgresql_where=sa.text("validation_status = 'pending_ma_validation'"),
+    )
+
+
+def downgrade() -> None:
+    """Remove the validation queue index."""
+    op.drop_index('idx_pending_validation_queue', 'pending_submissions')
@@ -0,0 +1,40 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# Copyright (C) 2024-2026 The Birthmark Standard Foundation
+
+"""Drop duplicate and low-selectivity pending_submissions indexes
+
+Revision ID: trim_pending_indexes
+Revises: add_validation_queue_index
+Create Date: 2026-10-17
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'trim_pending_indexes'
+down_revision = 'add_validation_queue_index'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Drop indexes that duplicate an idx_pending_* index or are never selective."""
+    # Same columns as idx_pending_validated, idx_pending_transaction_id
+    # and idx_pending_parent_hash
+    op.drop_index(op.f('ix_pending_submissions_sma_validated'), table_name='pending_submissions')
+    op.drop_index(op.f('ix_pending_submissions_transaction_id'), table_name='pending_submissions')
+    op.drop_index(op.f('ix_pending_submissions_parent_image_hash'), table_name='pending_submissions')
+
+    # modification_level only takes the values 0 and 1 and is never filtered on
+    op.drop_index(op.f('ix_pending_submissions_modification_level'), table_name='pending_submissions')
+    op.drop_index('idx_pending_modification_level', table_name='pending_submissions')
+
+
+def downgrade() -> None:
+    """Recreate the dropped indexes."""
+    op.create_index('idx_pending_modification_level', 'pending_submissions', ['modification_level'], unique=False)
+    op.create_index(op.f('ix_pending_submissions_modification_level'), 'pending_submissions', ['modification_level'], unique=False)
+    op.create_index(op.f('ix_pending_submissions_parent_image_hash'), 'pending_submissions', ['parent_image_hash'], unique=False)
+    op.create_index(op.f('ix_pending_submissions_transaction_id'), 'pending_submissions', ['transaction_id'], unique=False)
+    op.create_index(op.f('ix_pending_submissions_sma_validated'), 'pending_submissions', ['sma_validated'], unique=False)
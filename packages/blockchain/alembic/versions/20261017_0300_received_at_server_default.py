@@ -0,0 +1,33 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# Copyright (C) 2024-2026 The Birthmark Standard Foundation
+
+"""Assign pending_submissions.received_at on the database side
+
+Revision ID: received_at_server_default
+Revises: trim_pending_indexes
+Create Date: 2026-10-17
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'received_at_server_default'
+down_revision = 'trim_pending_indexes'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Default received_at to the current UTC time (naive, like utcnow())."""
+    op.alter_column(
+        'pending_submissions',
+        'received_at',
+        server_default=sa.text("timezone('utc', now())"),
+    )
+
+
+def downgrade() -> None:
+    """Drop the received_at server default."""
+    op.alter_column('pending_submissions', 'received_at', server_default=None)
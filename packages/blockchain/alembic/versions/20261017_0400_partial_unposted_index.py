@@ -0,0 +1,52 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# Copyright (C) 2024-2026 The Birthmark Standard Foundation
+
+"""Replace the blockchain_posted index with a partial index on unposted rows
+
+Revision ID: partial_unposted_index
+Revises: received_at_server_default
+Create Date: 2026-10-17
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'partial_unposted_index'
+down_revision = 'received_at_server_default'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Index only submissions not yet posted to the blockchain."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'idx_pending_unposted',
+            'pending_submissions',
+            ['id'],
+            postgresql_where=sa.text("blockchain_posted = false"),
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'idx_pending_blockchain_posted',
+            'pending_submissions',
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Restore the full blockchain_posted index."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'idx_pending_blockchain_posted',
+            'pending_submissions',
+            ['blockchain_posted'],
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'idx_pending_unposted',
+            'pending_submissions',
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,51 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# Copyright (C) 2024-2026 The Birthmark Standard Foundation
+
+"""Replace the pending image_hash index with a covering (image_hash, timestamp) index
+
+Revision ID: pending_hash_timestamp_index
+Revises: partial_unposted_index
+Create Date: 2026-10-17
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'pending_hash_timestamp_index'
+down_revision = 'partial_unposted_index'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Cover the certificate idempotency lookup; drop the narrower index."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'idx_pending_hash_timestamp',
+            'pending_submissions',
+            ['image_hash', 'timestamp'],
+            postgresql_include=['transaction_id', 'sma_validated'],
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'ix_pending_submissions_image_hash',
+            'pending_submissions',
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Restore the single-column image_hash index."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_pending_submissions_image_hash',
+            'pending_submissions',
+            ['image_hash'],
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'idx_pending_hash_timestamp',
+            'pending_submissions',
+            postgresql_concurrently=True,
+        )
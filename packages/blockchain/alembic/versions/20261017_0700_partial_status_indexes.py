@@ -0,0 +1,64 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# Copyright (C) 2024-2026 The Birthmark Standard Foundation
+
+"""Replace the full status indexes with a partial validated-queue index
+
+Revision ID: partial_status_indexes
+Revises: pending_hash_timestamp_index
+Create Date: 2026-10-17
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'partial_status_indexes'
+down_revision = 'pending_hash_timestamp_index'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Index only validated rows; drop the low-cardinality full indexes."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'idx_pending_validated_queue',
+            'pending_submissions',
+            ['received_at'],
+            postgresql_where=sa.text("sma_validated = true"),
+            postgresql_concurrently=True,
+        )
+        # The pending side is already served by idx_pending_validation_queue
+        op.drop_index(
+            'idx_pending_validation_status',
+            'pending_submissions',
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'idx_pending_validated',
+            'pending_submissions',
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Restore the full status indexes."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'idx_pending_validated',
+            'pending_submissions',
+            ['sma_validated'],
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'idx_pending_validation_status',
+            'pending_submissions',
+            ['validation_status'],
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'idx_pending_validated_queue',
+            'pending_submissions',
+            postgresql_concurrently=True,
+        )
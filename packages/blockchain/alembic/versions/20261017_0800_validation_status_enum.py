@@ -0,0 +1,85 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# Copyright (C) 2024-2026 The Birthmark Standard Foundation
+
+"""Store pending_submissions.validation_status as a PostgreSQL ENUM
+
+Revision ID: validation_status_enum
+Revises: partial_status_indexes
+Create Date: 2026-10-17
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = 'validation_status_enum'
+down_revision = 'partial_status_indexes'
+branch_labels = None
+depends_on = None
+
+validation_status_enum = postgresql.ENUM(
+    'pending_ma_validation',
+    'validated',
+    'rejected',
+    'validation_failed',
+    name='validation_status_enum',
+)
+
+
+def _drop_queue_index() -> None:
+    op.drop_index('idx_pending_validation_queue', 'pending_submissions')
+
+
+def _create_queue_index() -> None:
+    op.create_index(
+        'idx_pending_validation_queue',
+        'pending_submissions',
+        ['received_at'],
+        postgresql_where=sa.text("validation_status = 'pending_ma_validation'"),
+    )
+
+
+def upgrade() -> None:
+    """Convert validation_status from VARCHAR(50) to a 4-byte enum."""
+    validation_status_enum.create(op.get_bind())
+
+    # The queue index predicate compares against a text literal; rebuild it
+    # against the new type. The text default cannot be cast in place either.
+    _drop_queue_index()
+    op.alter_column('pending_submissions', 'validation_status', server_default=None)
+    op.alter_column(
+        'pending_submissions',
+        'validation_status',
+        type_=validation_status_enum,
+        existing_nullable=False,
+        postgresql_using='validation_status::validation_status_enum',
+    )
+    op.alter_column(
+        'pending_submissions',
+        'validation_status',
+        server_default='pending_ma_validation',
+    )
+    _create_queue_index()
+
+
+def downgrade() -> None:
+    """Convert validation_status back to VARCHAR(50)."""
+    _drop_queue_index()
+    op.alter_column('pending_submissions', 'validation_status', server_default=None)
+    op.alter_column(
+        'pending_submissions',
+        'validation_status',
+        type_=sa.String(50),
+        existing_nullable=False,
+        postgresql_using='validation_status::text',
+    )
+    op.alter_column(
+        'pending_submissions',
+        'validation_status',
+        server_default='pending_ma_validation',
+    )
+    _create_queue_index()
+
+    validation_status_enum.drop(op.get_bind())
@@ -0,0 +1,46 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# Copyright (C) 2024-2026 The Birthmark Standard Foundation
+
+"""Drop indexes shadowed by a primary key, unique index or identical index
+
+Revision ID: drop_duplicate_indexes
+Revises: validation_status_enum
+Create Date: 2026-10-17
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'drop_duplicate_indexes'
+down_revision = 'validation_status_enum'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Drop indexes whose columns another index already covers."""
+    # blocks.block_height is the primary key
+    op.drop_index('idx_blocks_height', table_name='blocks')
+
+    # Same columns as idx_tx_block, idx_hashes_block and idx_hashes_parent
+    op.drop_index(op.f('ix_transactions_block_height'), table_name='transactions')
+    op.drop_index(op.f('ix_image_hashes_block_height'), table_name='image_hashes')
+    op.drop_index(op.f('ix_image_hashes_parent_image_hash'), table_name='image_hashes')
+
+    # Same columns as idx_mod_original and idx_mod_software; final_image_hash
+    # is already served by the unique ix_modification_records_final_image_hash
+    op.drop_index(op.f('ix_modification_records_original_image_hash'), table_name='modification_records')
+    op.drop_index(op.f('ix_modification_records_software_id'), table_name='modification_records')
+    op.drop_index('idx_mod_final', table_name='modification_records')
+
+
+def downgrade() -> None:
+    """Recreate the dropped indexes."""
+    op.create_index('idx_mod_final', 'modification_records', ['final_image_hash'], unique=False)
+    op.create_index(op.f('ix_modification_records_software_id'), 'modification_records', ['software_id'], unique=False)
+    op.create_index(op.f('ix_modification_records_original_image_hash'), 'modification_records', ['original_image_hash'], unique=False)
+    op.create_index(op.f('ix_image_hashes_parent_image_hash'), 'image_hashes', ['parent_image_hash'], unique=False)
+    op.create_index(op.f('ix_image_hashes_block_height'), 'image_hashes', ['block_height'], unique=False)
+    op.create_index(op.f('ix_transactions_block_height'), 'transactions', ['block_height'], unique=False)
+    op.create_index('idx_blocks_height', 'blocks', ['block_height'], unique=False)
@@ -0,0 +1,48 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# Copyright (C) 2024-2026 The Birthmark Standard Foundation
+
+"""Exclude rejected and failed submissions from the unposted partial index
+
+Revision ID: unposted_excludes_terminal
+Revises: drop_duplicate_indexes
+Create Date: 2026-10-17
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'unposted_excludes_terminal'
+down_revision = 'drop_duplicate_indexes'
+branch_labels = None
+depends_on = None
+
+
+def _recreate_unposted_index(predicate: str) -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'idx_pending_unposted',
+            'pending_submissions',
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'idx_pending_unposted',
+            'pending_submissions',
+            ['id'],
+            postgresql_where=sa.text(predicate),
+            postgresql_concurrently=True,
+        )
+
+
+def upgrade() -> None:
+    """Index only submissions that will still be posted."""
+    _recreate_unposted_index(
+        "blockchain_posted = false "
+        "AND validation_status NOT IN ('rejected', 'validation_failed')"
+    )
+
+
+def downgrade() -> None:
+    """Index every unposted submission again."""
+    _recreate_unposted_index("blockchain_posted = false")
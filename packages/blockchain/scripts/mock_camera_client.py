@@ -18,11 +18,13 @@ Usage:
 
     # Load testing (250 images)
     python scripts/mock_camera_client.py --continuous 250 --interval 0.1
+
+    # Load testing with at most 8 submissions in flight
+    python scripts/mock_camera_client.py --continuous 250 --interval 0 --concurrency 8
 """
 
 import asyncio
 import argparse
-import hashlib
 import secrets
 import time
 from typing import Dict, Any, Optional
@@ -33,24 +35,41 @@ import httpx
 AGGREGATOR_URL = "http://localhost:8545"
 MANUFACTURER_AUTHORITY_ID = "TEST_MFG_001"
 SMA_VALIDATION_ENDPOINT = "http://localhost:8001/validate"
+MAX_IN_FLIGHT = 32  # Concurrent submissions in continuous mode
+
+# Shared HTTP client; keeps connections to the aggregator alive across
+# submissions instead of reconnecting for every request
+_client: Optional[httpx.AsyncClient] = None
+
+
+def get_client() -> httpx.AsyncClient:
+    """Return the shared HTTP client, creating it on first use."""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(timeout=10.0)
+    return _client
+
+
+async def close_client() -> None:
+    """Close the shared HTTP client."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
 
 
 def generate_mock_hashes() -> tuple[str, str]:
     """
     Generate mock image hashes simulating raw Bayer and processed JPEG.
 
+    The server only ever sees the digests, and SHA-256 output is
+    indistinguishable from random, so random 32-byte values stand in for
+    hashing ~24MB of raw sensor data and a ~3MB JPEG.
+
     Returns:
         tuple: (raw_hash, processed_hash)
     """
-    # Simulate raw Bayer data hash
-    raw_data = secrets.token_bytes(24 * 1024 * 1024)  # ~24MB raw sensor data
-    raw_hash = hashlib.sha256(raw_data).hexdigest()
-
-    # Simulate processed JPEG hash (different from raw)
-    processed_data = secrets.token_bytes(3 * 1024 * 1024)  # ~3MB JPEG
-    processed_hash = hashlib.sha256(processed_data).hexdigest()
-
-    return raw_hash, processed_hash
+    return secrets.token_hex(32), secrets.token_hex(32)
 
 
 def generate_mock_camera_token() -> Dict[str, Any]:
@@ -113,24 +132,23 @@ async def submit_camera_capture(
     }
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.post(
-                f"{AGGREGATOR_URL}/api/v1/submit",
-                json=submission,
-            )
+        response = await get_client().post(
+            f"{AGGREGATOR_URL}/api/v1/submit",
+            json=submission,
+        )
 
-            if response.status_code == 202:
-                data = response.json()
-                print(f"✓ Submission accepted")
-                print(f"  Receipt ID: {data['receipt_id']}")
-                print(f"  Status: {data['status']}")
-                print(f"  Raw hash: {raw_hash[:16]}...")
-                print(f"  Processed hash: {processed_hash[:16]}...")
-                return data['receipt_id']
-            else:
-                print(f"✗ Submission failed: {response.status_code}")
-                print(f"  Response: {response.text}")
-                return None
+        if response.status_code == 202:
+            data = response.json()
+            print(f"✓ Submission accepted")
+            print(f"  Receipt ID: {data['receipt_id']}")
+            print(f"  Status: {data['status']}")
+            print(f"  Raw hash: {raw_hash[:16]}...")
+            print(f"  Processed hash: {processed_hash[:16]}...")
+            return data['receipt_id']
+        else:
+            print(f"✗ Submission failed: {response.status_code}")
+            print(f"  Response: {response.text}")
+            return None
 
     except httpx.ConnectError:
         print(f"✗ Cannot connect to aggregator at {AGGREGATOR_URL}")
@@ -152,28 +170,27 @@ async def verify_hash(image_hash: str) -> bool:
         bool: True if verified on blockchain, False otherwise
     """
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.get(
-                f"{AGGREGATOR_URL}/api/v1/verify/{image_hash}"
-            )
+        response = await get_client().get(
+            f"{AGGREGATOR_URL}/api/v1/verify/{image_hash}"
+        )
 
-            if response.status_code == 200:
-                data = response.json()
-
-                if data["verified"]:
-                    print(f"✓ Hash verified on blockchain")
-                    print(f"  Block height: {data.get('block_height', 'N/A')}")
-                    print(f"  Timestamp: {data.get('timestamp', 'N/A')}")
-                    return True
-                elif data.get("status") == "pending":
-                    print(f"⚠ Hash pending validation/batching")
-                    return False
-                else:
-                    print(f"✗ Hash not found")
-                    return False
+        if response.status_code == 200:
+            data = response.json()
+
+            if data["verified"]:
+                print(f"✓ Hash verified on blockchain")
+                print(f"  Block height: {data.get('block_height', 'N/A')}")
+                print(f"  Timestamp: {data.get('timestamp', 'N/A')}")
+                return True
+            elif data.get("status") == "pending":
+                print(f"⚠ Hash pending validation/batching")
+                return False
             else:
-                print(f"✗ Verification query failed: {response.status_code}")
+                print(f"✗ Hash not found")
                 return False
+        else:
+            print(f"✗ Verification query failed: {response.status_code}")
+            return False
 
     except Exception as e:
         print(f"✗ Error verifying: {e}")
@@ -240,13 +257,21 @@ async def capture_and_verify() -> bool:
     return receipt_id is not None
 
 
-async def continuous_capture(count: int, interval: float = 1.0) -> Dict[str, int]:
+async def continuous_capture(
+    count: int,
+    interval: float = 1.0,
+    concurrency: int = MAX_IN_FLIGHT,
+) -> Dict[str, int]:
     """
     Simulate continuous camera captures for load testing.
 
+    Captures are launched every `interval` seconds and may overlap, with at
+    most `concurrency` submissions in flight at once.
+
     Args:
         count: Number of captures to simulate
-        interval: Seconds between captures
+        interval: Seconds between capture launches
+        concurrency: Maximum number of submissions in flight
 
     Returns:
         dict: Statistics (submitted, failed, verified)
@@ -261,31 +286,34 @@ async def continuous_capture(count: int, interval: float = 1.0) -> Dict[str, int
         "verified": 0,
     }
 
-    start_time = time.time()
+    semaphore = asyncio.Semaphore(concurrency)
 
-    for i in range(count):
-        print(f"\n--- Capture {i+1}/{count} ---")
+    async def capture(i: int) -> None:
+        # Stagger launches by the interval, then wait for a free slot
+        await asyncio.sleep(i * interval)
+        async with semaphore:
+            print(f"\n--- Capture {i+1}/{count} ---")
 
-        # Generate and submit
-        raw_hash, processed_hash = generate_mock_hashes()
-        camera_token = generate_mock_camera_token()
-        timestamp = int(time.time())
+            # Generate and submit
+            raw_hash, processed_hash = generate_mock_hashes()
+            camera_token = generate_mock_camera_token()
+            timestamp = int(time.time())
 
-        receipt_id = await submit_camera_capture(
-            raw_hash=raw_hash,
-            processed_hash=processed_hash,
-            camera_token=camera_token,
-            timestamp=timestamp,
-        )
+            receipt_id = await submit_camera_capture(
+                raw_hash=raw_hash,
+                processed_hash=processed_hash,
+                camera_token=camera_token,
+                timestamp=timestamp,
+            )
 
         if receipt_id:
             stats["submitted"] += 1
         else:
             stats["failed"] += 1
 
-        # Wait before next capture
-        if i < count - 1:  # Don't wait after last capture
-            await asyncio.sleep(interval)
+    start_time = time.time()
+
+    await asyncio.gather(*(capture(i) for i in range(count)))
 
     elapsed = time.time() - start_time
 
@@ -331,13 +359,23 @@ async def main():
         metavar="SECONDS",
         help="Interval between captures in continuous mode (default: 1.0)",
     )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=MAX_IN_FLIGHT,
+        metavar="N",
+        help=f"Maximum in-flight submissions in continuous mode (default: {MAX_IN_FLIGHT})",
+    )
 
     args = parser.parse_args()
 
-    if args.continuous:
-        await continuous_capture(args.continuous, args.interval)
-    else:
-        await capture_and_verify()
+    try:
+        if args.continuous:
+            await continuous_capture(args.continuous, args.interval, args.concurrency)
+        else:
+            await capture_and_verify()
+    finally:
+        await close_client()
 
 
 if __name__ == "__main__":
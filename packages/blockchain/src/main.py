@@ -16,6 +16,8 @@ from src.shared.config import settings
 from src.shared.crypto.signatures import ValidatorKeys
 from src.submission_server.api import submissions, modifications
 from src.submission_server.validation.validation_worker import validation_worker
+from src.submission_server.validation.sma_client import sma_client
+from src.submission_server.blockchain.blockchain_client import blockchain_client
 from src.node.api import verification, status
 from src.node.api import blockchain
 
@@ -26,6 +28,10 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Keep SQL statement logging opt-in even when log_level is DEBUG
+if not settings.sql_echo:
+    logging.getLogger("sqlalchemy.engine").setLevel(logging.WARNING)
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -56,6 +62,10 @@ async def lifespan(app: FastAPI):
     except asyncio.CancelledError:
         pass
 
+    # Close pooled HTTP connections to the SMA and blockchain node
+    await sma_client.aclose()
+    await blockchain_client.aclose()
+
 
 def load_or_generate_keys() -> ValidatorKeys:
     """Load validator keys from file or generate new ones."""
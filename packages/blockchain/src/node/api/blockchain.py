@@ -19,7 +19,7 @@ from typing import Optional
 from fastapi import APIRouter, HTTPException, Depends
 from pydantic import BaseModel, Field
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
+from sqlalchemy import bindparam, select, func
 
 from src.shared.database.models import Block, Transaction, ImageHash, NodeState
 from src.shared.database.connection import get_db
@@ -28,6 +28,27 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/v1/blockchain", tags=["blockchain"])
 
+# Hot-path statements are built once; handlers execute them with bound values.
+# The verify lookup is read-only, so it selects plain columns (no ORM objects).
+_VERIFY_HASH = select(
+    ImageHash.timestamp,
+    ImageHash.block_height,
+    ImageHash.tx_id,
+    ImageHash.modification_level,
+    ImageHash.parent_image_hash,
+    Transaction.submission_server_id,
+).join(
+    Transaction, ImageHash.tx_id == Transaction.tx_id
+).where(ImageHash.image_hash == bindparam("image_hash"))
+_STATE_AND_HASH_COUNT = select(
+    NodeState, select(func.count(ImageHash.image_hash)).scalar_subquery()
+).where(NodeState.id == 1)
+_STATE_AND_CURRENT_BLOCK = (
+    select(NodeState, Block)
+    .outerjoin(Block, Block.block_height == NodeState.current_block_height)
+    .where(NodeState.id == 1)
+)
+
 
 class HashSubmission(BaseModel):
     """Single hash submission from submission server."""
@@ -130,23 +151,19 @@ async def verify_hash(
     Returns verification status with block height, timestamp, and provenance chain.
     """
     # Query for hash with joined transaction to get submission_server_id
-    stmt = select(ImageHash, Transaction.submission_server_id).join(
-        Transaction, ImageHash.tx_id == Transaction.tx_id
-    ).where(ImageHash.image_hash == image_hash)
-    result = await db.execute(stmt)
+    result = await db.execute(_VERIFY_HASH, {"image_hash": image_hash})
     row = result.one_or_none()
 
     if row:
-        hash_record, submission_server_id = row
         logger.info(f"🔍 Verification: Hash {image_hash[:16]}... found (verified)")
         return HashVerification(
             verified=True,
-            timestamp=hash_record.timestamp,
-            block_height=hash_record.block_height,
-            tx_id=hash_record.tx_id,
-            submission_server_id=submission_server_id,
-            modification_level=hash_record.modification_level,
-            parent_image_hash=hash_record.parent_image_hash
+            timestamp=row.timestamp,
+            block_height=row.block_height,
+            tx_id=row.tx_id,
+            submission_server_id=row.submission_server_id,
+            modification_level=row.modification_level,
+            parent_image_hash=row.parent_image_hash
         )
     else:
         logger.info(f"🔍 Verification: Hash {image_hash[:16]}... not found")
@@ -156,13 +173,17 @@ async def verify_hash(
 @router.get("/status")
 async def blockchain_status(db: AsyncSession = Depends(get_db)) -> dict:
     """Get blockchain node status."""
-    # Get node state
-    node_state = await get_node_state(db)
+    # Node state and total hashes in one round trip
+    result = await db.execute(_STATE_AND_HASH_COUNT)
+    row = result.one_or_none()
 
-    # Get total hashes
-    stmt = select(func.count(ImageHash.image_hash))
-    result = await db.execute(stmt)
-    total_hashes = result.scalar_one()
+    if row:
+        node_state, total_hashes = row
+    else:
+        # No node state yet: initialize it, then count separately
+        node_state = await get_node_state(db)
+        result = await db.execute(select(func.count(ImageHash.image_hash)))
+        total_hashes = result.scalar_one()
 
     return {
         "node_id": node_state.node_id,
@@ -179,26 +200,32 @@ async def get_or_create_current_block(db: AsyncSession) -> Block:
 
     Phase 1: Simple strategy - new block every 100 transactions or 5 minutes.
     """
-    node_state = await get_node_state(db)
+    # Node state and its current block in one round trip
+    result = await db.execute(_STATE_AND_CURRENT_BLOCK)
+    row = result.one_or_none()
 
-    # Check if current block exists
-    if node_state.current_block_height > 0:
-        stmt = select(Block).where(Block.block_height == node_state.current_block_height)
-        result = await db.execute(stmt)
-        current_block = result.scalar_one_or_none()
+    if row is None:
+        # First submission: initialize node state
+        node_state, current_block = await get_node_state(db), None
+    else:
+        node_state, current_block = row
 
-        if current_block:
-            # Check if we need a new block (100 transactions or 5 min old)
-            age_seconds = (datetime.utcnow() - current_block.created_at).total_seconds()
-            if current_block.transaction_count >= 100 or age_seconds >= 300:
-                return await create_new_block(db, node_state)
-            return current_block
+    if current_block:
+        # Check if we need a new block (100 transactions or 5 min old)
+        age_seconds = (datetime.utcnow() - current_block.created_at).total_seconds()
+        if current_block.transaction_count >= 100 or age_seconds >= 300:
+            return await create_new_block(db, node_state, current_block)
+        return current_block
 
     # No current block, create genesis or next
     return await create_new_block(db, node_state)
 
 
-async def create_new_block(db: AsyncSession, node_state: NodeState) -> Block:
+async def create_new_block(
+    db: AsyncSession,
+    node_state: NodeState,
+    previous_block: Optional[Block] = None,
+) -> Block:
     """Create new block."""
     new_height = node_state.current_block_height + 1
 
@@ -206,6 +233,8 @@ async def create_new_block(db: AsyncSession, node_state: NodeState) -> Block:
     if new_height == 1:
         # Genesis block
         previous_hash = "0" * 64
+    elif previous_block is not None:
+        previous_hash = previous_block.block_hash
     else:
         stmt = select(Block.block_hash).where(
             Block.block_height == node_state.current_block_height
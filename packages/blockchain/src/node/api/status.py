@@ -4,14 +4,20 @@
 """Node status and health check endpoints."""
 
 import logging
+import time
 from datetime import datetime, timedelta
+from typing import Optional, Tuple
 
 from fastapi import APIRouter, Depends
-from sqlalchemy import select, func
+from sqlalchemy import func, literal, select, text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.shared.database.connection import get_db
-from src.shared.database.models import NodeState, PendingSubmission
+from src.shared.database.models import (
+    PENDING_UNPOSTED_PREDICATE,
+    NodeState,
+    PendingSubmission,
+)
 from src.shared.models.schemas import NodeStatus
 from src.shared.config import settings
 
@@ -22,6 +28,33 @@ router = APIRouter(tags=["status"])
 # Track when server started (for uptime calculation)
 SERVER_START_TIME = datetime.utcnow()
 
+# The pending count is a COUNT(*) over a growing table; status polls within
+# this window reuse the last value instead of rescanning
+PENDING_COUNT_TTL_SECONDS = 1.0
+_pending_count_cache: Optional[Tuple[float, int]] = None  # (monotonic time, count)
+
+# Submissions still waiting to reach the blockchain, counted on the
+# idx_pending_unposted predicate
+_PENDING_COUNT = (
+    select(func.count(PendingSubmission.id))
+    .where(text(PENDING_UNPOSTED_PREDICATE))
+    .scalar_subquery()
+    .label("pending_count")
+)
+
+# The node_state row is read once; outer-joining it to a one-row select still
+# yields a row (with NULLs) before the first block creates it
+_NODE_STATE = (
+    select(
+        NodeState.current_block_height.label("block_height"),
+        NodeState.total_hashes,
+        NodeState.last_block_time,
+    )
+    .select_from(select(literal(1).label("one")).subquery())
+    .outerjoin(NodeState, NodeState.id == 1)
+)
+_NODE_STATE_AND_PENDING = _NODE_STATE.add_columns(_PENDING_COUNT)
+
 
 @router.get("/health")
 async def health_check() -> dict:
@@ -47,21 +80,26 @@ async def get_node_status(
     Returns:
         Node status including block height, pending submissions, etc.
     """
-    # Get node state
-    stmt = select(NodeState).where(NodeState.id == 1)
-    result = await db.execute(stmt)
-    state = result.scalar_one_or_none()
-
-    block_height = state.current_block_height if state else 0
-    total_hashes = state.total_hashes if state else 0
-    last_block_time = state.last_block_time if state else None
-
-    # Count pending submissions
-    stmt = select(func.count(PendingSubmission.id)).where(
-        PendingSubmission.batched == False  # noqa: E712
+    global _pending_count_cache
+
+    now = time.monotonic()
+    count_is_fresh = (
+        _pending_count_cache is not None
+        and now - _pending_count_cache[0] < PENDING_COUNT_TTL_SECONDS
     )
-    result = await db.execute(stmt)
-    pending_count = result.scalar_one()
+
+    # Node state and pending count in one round trip
+    result = await db.execute(_NODE_STATE if count_is_fresh else _NODE_STATE_AND_PENDING)
+    row = result.one()
+
+    block_height = row.block_height or 0
+    total_hashes = row.total_hashes or 0
+    last_block_time = row.last_block_time
+    if count_is_fresh:
+        pending_count = _pending_count_cache[1]
+    else:
+        pending_count = row.pending_count
+        _pending_count_cache = (now, pending_count)
 
     # Calculate uptime
     uptime_seconds = (datetime.utcnow() - SERVER_START_TIME).total_seconds()
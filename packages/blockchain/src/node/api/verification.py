@@ -10,7 +10,12 @@ from fastapi import APIRouter, Depends, HTTPException, Path, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.shared.database.connection import get_db
-from src.shared.models.schemas import VerificationResponse, BlockInfo
+from src.shared.models.schemas import (
+    BatchVerificationRequest,
+    BatchVerificationResponse,
+    BlockInfo,
+    VerificationResponse,
+)
 from src.node.storage.block_storage import block_storage
 
 logger = logging.getLogger(__name__)
@@ -65,6 +70,51 @@ async def verify_image(
         )
 
 
+@router.post("/verify/batch", response_model=BatchVerificationResponse)
+async def verify_images(
+    request: BatchVerificationRequest,
+    db: AsyncSession = Depends(get_db),
+) -> BatchVerificationResponse:
+    """
+    Verify up to 100 image hashes in one call.
+
+    All hashes are looked up with a single query rather than one query
+    per hash.
+
+    Args:
+        request: Hashes to verify (normalized to lowercase)
+        db: Database session
+
+    Returns:
+        One verification result per requested hash, in request order
+    """
+    logger.info(f"Batch verification query for {len(request.image_hashes)} hashes")
+
+    found = await block_storage.verify_image_hashes(request.image_hashes, db)
+
+    # Results are built from validated input and database rows, so skip
+    # per-item Pydantic validation with model_construct
+    results = []
+    for image_hash in request.image_hashes:
+        row = found.get(image_hash)
+        if row:
+            results.append(VerificationResponse.model_construct(
+                verified=True,
+                image_hash=row.image_hash,
+                timestamp=row.timestamp,
+                block_height=row.block_height,
+                aggregator=row.submission_server_id,
+                gps_hash=row.gps_hash,
+            ))
+        else:
+            results.append(VerificationResponse.model_construct(
+                verified=False,
+                image_hash=image_hash,
+            ))
+
+    return BatchVerificationResponse.model_construct(results=results)
+
+
 @router.get("/block/{block_height}", response_model=BlockInfo)
 async def get_block(
     block_height: int = Path(..., ge=0, description="Block height"),
@@ -12,8 +12,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.shared.models.schemas import BatchTransaction, BlockProposal
 from src.shared.crypto.signatures import ValidatorKeys
-from src.shared.crypto.hashing import compute_block_hash
-from src.node.storage.block_storage import block_storage
+from src.node.storage.block_storage import block_storage, compute_transaction_hashes
 from src.node.consensus.transaction_validator import transaction_validator
 
 logger = logging.getLogger(__name__)
@@ -104,15 +103,7 @@ class SingleNodeConsensus(ConsensusEngine):
         timestamp = int(time.time())
 
         # Compute transaction hashes for block hash
-        from src.shared.crypto.hashing import compute_transaction_hash
-        tx_hashes = [
-            compute_transaction_hash(
-                tx.image_hashes,
-                tx.timestamps,
-                tx.aggregator_id,
-            )
-            for tx in transactions
-        ]
+        tx_hashes = compute_transaction_hashes(transactions)
 
         # Sign block
         block_data = f"{block_height}{previous_hash}{timestamp}{','.join(tx_hashes)}{validator_id}"
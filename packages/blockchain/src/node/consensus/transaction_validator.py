@@ -4,17 +4,23 @@
 """Transaction validation logic (replaces smart contracts)."""
 
 import logging
+import time
 from typing import Optional
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.shared.config import settings
 from src.shared.database.models import ImageHash
 from src.shared.models.schemas import BatchTransaction
 from src.shared.crypto.hashing import verify_hash_format
 
 logger = logging.getLogger(__name__)
 
+# Accepted capture timestamp window, relative to the validator's clock
+MAX_CLOCK_SKEW_SECONDS = 300  # 5 minutes into the future
+MAX_TIMESTAMP_AGE_SECONDS = 365 * 24 * 60 * 60  # 1 year into the past
+
 
 class TransactionValidator:
     """
@@ -76,16 +82,16 @@ class TransactionValidator:
             return False, f"Duplicate hash(es) already on blockchain: {duplicate_check}"
 
         # Check 6: Valid timestamps (not in future, not too old)?
-        import time
         current_time = int(time.time())
+        newest_allowed = current_time + MAX_CLOCK_SKEW_SECONDS
+        oldest_allowed = current_time - MAX_TIMESTAMP_AGE_SECONDS
         for ts in transaction.timestamps:
-            if ts > current_time + 300:  # 5 minutes tolerance for clock skew
+            if ts > newest_allowed:
                 return False, f"Timestamp in future: {ts}"
-            if ts < current_time - (365 * 24 * 60 * 60):  # Not more than 1 year old
+            if ts < oldest_allowed:
                 return False, f"Timestamp too old: {ts}"
 
         # Check 7: Batch size within limits?
-        from src.shared.config import settings
         if len(transaction.image_hashes) < settings.batch_size_min:
             return False, f"Batch too small: {len(transaction.image_hashes)} < {settings.batch_size_min}"
         if len(transaction.image_hashes) > settings.batch_size_max:
@@ -137,8 +143,6 @@ class TransactionValidator:
         Returns:
             (is_valid, error_message)
         """
-        from src.shared.config import settings
-
         if batch_size < settings.batch_size_min:
             return False, f"Batch size {batch_size} below minimum {settings.batch_size_min}"
 
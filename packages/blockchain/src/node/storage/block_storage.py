@@ -7,15 +7,50 @@ import logging
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import select, func
+from sqlalchemy import Row, bindparam, func, insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.shared.config import settings
 from src.shared.database.models import Block, Transaction, ImageHash, NodeState
 from src.shared.models.schemas import BatchTransaction, BlockInfo, TransactionInfo
 from src.shared.crypto.hashing import compute_block_hash, compute_transaction_hash
 
 logger = logging.getLogger(__name__)
 
+# Read statements are built once; handlers execute them with bound values
+_LATEST_BLOCK = select(Block).order_by(Block.block_height.desc()).limit(1)
+_BLOCK_BY_HEIGHT = select(Block).where(Block.block_height == bindparam("height"))
+_BLOCK_BY_HASH = select(Block).where(Block.block_hash == bindparam("block_hash"))
+_IMAGE_HASH = select(ImageHash).where(ImageHash.image_hash == bindparam("image_hash"))
+_IMAGE_HASHES = (
+    select(
+        ImageHash.image_hash,
+        ImageHash.timestamp,
+        ImageHash.block_height,
+        ImageHash.gps_hash,
+        Transaction.submission_server_id,
+    )
+    .join(Transaction, ImageHash.tx_id == Transaction.tx_id)
+    .where(ImageHash.image_hash.in_(bindparam("image_hashes", expanding=True)))
+)
+_HASH_COUNT = select(func.count(ImageHash.image_hash))
+_NODE_STATE = select(NodeState).where(NodeState.id == 1)
+_NODE_STATE_AND_HASH_COUNT = select(NodeState, _HASH_COUNT.scalar_subquery()).where(
+    NodeState.id == 1
+)
+
+
+def compute_transaction_hashes(transactions: list[BatchTransaction]) -> list[str]:
+    """Compute the hash of each transaction, in block order."""
+    return [
+        compute_transaction_hash(
+            tx.image_hashes,
+            tx.timestamps,
+            tx.aggregator_id,
+        )
+        for tx in transactions
+    ]
+
 
 class BlockStorage:
     """Manages blockchain storage in PostgreSQL."""
@@ -46,14 +81,7 @@ class BlockStorage:
             Created Block object
         """
         # Compute transaction hashes
-        tx_hashes = [
-            compute_transaction_hash(
-                tx.image_hashes,
-                tx.timestamps,
-                tx.aggregator_id,
-            )
-            for tx in transactions
-        ]
+        tx_hashes = compute_transaction_hashes(transactions)
 
         # Compute block hash
         block_hash = compute_block_hash(
@@ -75,35 +103,45 @@ class BlockStorage:
             signature=signature,
         )
         db.add(block)
-
-        # Create transactions and image hashes
-        for tx_data, tx_hash in zip(transactions, tx_hashes):
-            # Create transaction
-            tx = Transaction(
-                tx_hash=tx_hash,
-                block_height=block_height,
-                aggregator_id=tx_data.aggregator_id,
-                batch_size=len(tx_data.image_hashes),
-                signature=tx_data.signature,
+        await db.flush()
+
+        # Create all transactions in one executemany INSERT; RETURNING in
+        # parameter order pairs each generated tx_id with its input
+        tx_ids = []
+        if transactions:
+            result = await db.execute(
+                insert(Transaction).returning(
+                    Transaction.tx_id, sort_by_parameter_order=True
+                ),
+                [
+                    {
+                        "tx_hash": tx_hash,
+                        "block_height": block_height,
+                        "submission_server_id": tx_data.aggregator_id,
+                        "batch_size": len(tx_data.image_hashes),
+                        "signature": tx_data.signature,
+                    }
+                    for tx_data, tx_hash in zip(transactions, tx_hashes)
+                ],
+            )
+            tx_ids = result.scalars().all()
+
+        # Create image hash records for every transaction in a single INSERT
+        rows = []
+        for tx_data, tx_id in zip(transactions, tx_ids):
+            gps_hashes = tx_data.gps_hashes or []
+            rows.extend(
+                {
+                    "image_hash": image_hash,
+                    "tx_id": tx_id,
+                    "block_height": block_height,
+                    "timestamp": tx_data.timestamps[i],
+                    "gps_hash": gps_hashes[i] if i < len(gps_hashes) else None,
+                }
+                for i, image_hash in enumerate(tx_data.image_hashes)
             )
-            db.add(tx)
-            await db.flush()  # Get tx_id
-
-            # Create image hash records
-            for i, image_hash in enumerate(tx_data.image_hashes):
-                gps_hash = None
-                if tx_data.gps_hashes and i < len(tx_data.gps_hashes):
-                    gps_hash = tx_data.gps_hashes[i]
-
-                img_hash = ImageHash(
-                    image_hash=image_hash,
-                    tx_id=tx.tx_id,
-                    block_height=block_height,
-                    timestamp=tx_data.timestamps[i],
-                    aggregator_id=tx_data.aggregator_id,
-                    gps_hash=gps_hash,
-                )
-                db.add(img_hash)
+        if rows:
+            await db.execute(insert(ImageHash), rows)
 
         await db.commit()
         logger.info(
@@ -118,8 +156,7 @@ class BlockStorage:
 
     async def get_latest_block(self, db: AsyncSession) -> Optional[Block]:
         """Get most recent block."""
-        stmt = select(Block).order_by(Block.block_height.desc()).limit(1)
-        result = await db.execute(stmt)
+        result = await db.execute(_LATEST_BLOCK)
         return result.scalar_one_or_none()
 
     async def get_block_by_height(
@@ -128,8 +165,7 @@ class BlockStorage:
         db: AsyncSession,
     ) -> Optional[Block]:
         """Get block by height."""
-        stmt = select(Block).where(Block.block_height == height)
-        result = await db.execute(stmt)
+        result = await db.execute(_BLOCK_BY_HEIGHT, {"height": height})
         return result.scalar_one_or_none()
 
     async def get_block_by_hash(
@@ -138,8 +174,7 @@ class BlockStorage:
         db: AsyncSession,
     ) -> Optional[Block]:
         """Get block by hash."""
-        stmt = select(Block).where(Block.block_hash == block_hash)
-        result = await db.execute(stmt)
+        result = await db.execute(_BLOCK_BY_HASH, {"block_hash": block_hash})
         return result.scalar_one_or_none()
 
     async def verify_image_hash(
@@ -157,14 +192,35 @@ class BlockStorage:
         Returns:
             ImageHash record if found, None otherwise
         """
-        stmt = select(ImageHash).where(ImageHash.image_hash == image_hash)
-        result = await db.execute(stmt)
+        result = await db.execute(_IMAGE_HASH, {"image_hash": image_hash})
         return result.scalar_one_or_none()
 
+    async def verify_image_hashes(
+        self,
+        image_hashes: list[str],
+        db: AsyncSession,
+    ) -> dict[str, Row]:
+        """
+        Look up many image hashes in a single query.
+
+        Read-only: returns plain rows rather than ORM objects, so nothing is
+        added to the session's identity map.
+
+        Args:
+            image_hashes: SHA-256 hashes to verify
+            db: Database session
+
+        Returns:
+            Mapping of found hash to a row with image_hash, timestamp,
+            block_height, gps_hash and submission_server_id; hashes not on
+            the blockchain are absent
+        """
+        result = await db.execute(_IMAGE_HASHES, {"image_hashes": image_hashes})
+        return {row.image_hash: row for row in result}
+
     async def get_total_hash_count(self, db: AsyncSession) -> int:
         """Get total number of image hashes on blockchain."""
-        stmt = select(func.count(ImageHash.image_hash))
-        result = await db.execute(stmt)
+        result = await db.execute(_HASH_COUNT)
         return result.scalar_one()
 
     async def update_node_state(
@@ -174,13 +230,14 @@ class BlockStorage:
         block_hash: str,
     ) -> None:
         """Update node state after new block."""
-        from src.shared.config import settings
-
-        stmt = select(NodeState).where(NodeState.id == 1)
-        result = await db.execute(stmt)
-        state = result.scalar_one_or_none()
-
-        if not state:
+        # State row and total hash count in one round trip
+        result = await db.execute(_NODE_STATE_AND_HASH_COUNT)
+        row = result.one_or_none()
+
+        if row:
+            state, total = row
+        else:
+            # First block only: no state row yet, count separately
             state = NodeState(
                 id=1,
                 node_id=settings.node_id,
@@ -188,20 +245,17 @@ class BlockStorage:
                 total_hashes=0,
             )
             db.add(state)
+            total = await self.get_total_hash_count(db)
 
         state.current_block_height = block_height
         state.last_block_time = datetime.utcnow()
-
-        # Update total hashes count
-        total = await self.get_total_hash_count(db)
         state.total_hashes = total
 
         await db.commit()
 
     async def get_node_state(self, db: AsyncSession) -> Optional[NodeState]:
         """Get current node state."""
-        stmt = select(NodeState).where(NodeState.id == 1)
-        result = await db.execute(stmt)
+        result = await db.execute(_NODE_STATE)
         return result.scalar_one_or_none()
 
 
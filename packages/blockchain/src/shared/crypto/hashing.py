@@ -88,7 +88,8 @@ def verify_hash_format(hash_str: str) -> bool:
     if len(hash_str) != 64:
         return False
     try:
-        int(hash_str, 16)  # Check if valid hex
-        return True
+        # bytes.fromhex rejects signs, 0x prefixes and underscores that int()
+        # accepts; it skips whitespace, so also require 32 decoded bytes
+        return len(bytes.fromhex(hash_str)) == 32
     except ValueError:
         return False
@@ -20,7 +20,8 @@ sync_engine = create_engine(
     settings.database_url,
     pool_size=settings.database_pool_size,
     max_overflow=settings.database_max_overflow,
-    echo=settings.log_level == "DEBUG",
+    pool_recycle=settings.database_pool_recycle,
+    echo=settings.sql_echo,
 )
 
 # Async engine (for FastAPI endpoints)
@@ -29,7 +30,8 @@ async_engine = create_async_engine(
     async_database_url,
     pool_size=settings.database_pool_size,
     max_overflow=settings.database_max_overflow,
-    echo=settings.log_level == "DEBUG",
+    pool_recycle=settings.database_pool_recycle,
+    echo=settings.sql_echo,
 )
 
 # Session factories
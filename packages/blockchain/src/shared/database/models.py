@@ -12,6 +12,7 @@ from sqlalchemy import (
     CHAR,
     Column,
     DateTime,
+    Enum,
     ForeignKey,
     Index,
     Integer,
@@ -19,6 +20,7 @@ from sqlalchemy import (
     String,
     Text,
     ARRAY,
+    text,
 )
 from sqlalchemy.orm import relationship
 
@@ -47,8 +49,6 @@ class Block(Base):
     # Relationships
     transactions = relationship("Transaction", back_populates="block", cascade="all, delete-orphan")
 
-    __table_args__ = (Index("idx_blocks_height", "block_height"),)
-
 
 class Transaction(Base):
     """
@@ -62,7 +62,7 @@ class Transaction(Base):
 
     tx_id = Column(Integer, primary_key=True, autoincrement=True)
     tx_hash = Column(CHAR(64), nullable=False, unique=True, index=True)
-    block_height = Column(BigInteger, ForeignKey("blocks.block_height"), nullable=False, index=True)
+    block_height = Column(BigInteger, ForeignKey("blocks.block_height"), nullable=False)
     submission_server_id = Column(String(255), nullable=False)
     batch_size = Column(Integer, nullable=False)  # Number of hashes in this transaction
     signature = Column(Text, nullable=False)
@@ -91,11 +91,11 @@ class ImageHash(Base):
 
     image_hash = Column(CHAR(64), primary_key=True)
     tx_id = Column(Integer, ForeignKey("transactions.tx_id"), nullable=False, index=True)
-    block_height = Column(BigInteger, ForeignKey("blocks.block_height"), nullable=False, index=True)
+    block_height = Column(BigInteger, ForeignKey("blocks.block_height"), nullable=False)
     timestamp = Column(BigInteger, nullable=False)  # Unix timestamp (server processing time)
 
     # Provenance chain
-    parent_image_hash = Column(CHAR(64), nullable=True, index=True)  # For tracking raw->processed
+    parent_image_hash = Column(CHAR(64), nullable=True)  # For tracking raw->processed
     modification_level = Column(Integer, nullable=False, default=0)  # 0=raw, 1=processed, 2+=modified
 
     # Optional GPS location proof
@@ -114,6 +114,15 @@ class ImageHash(Base):
     )
 
 
+# Submissions that will still be posted to the blockchain: rejected and
+# permanently failed ones never are. Shared by idx_pending_unposted and the
+# status count so the planner can answer the count from the index.
+PENDING_UNPOSTED_PREDICATE = (
+    "blockchain_posted = false "
+    "AND validation_status NOT IN ('rejected', 'validation_failed')"
+)
+
+
 class PendingSubmission(Base):
     """
     Camera submissions awaiting SMA validation and blockchain submission.
@@ -125,12 +134,12 @@ class PendingSubmission(Base):
     __tablename__ = "pending_submissions"
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    image_hash = Column(CHAR(64), nullable=False, index=True)
+    image_hash = Column(CHAR(64), nullable=False)
 
     # Camera submission data
-    modification_level = Column(Integer, nullable=False, default=0, index=True)  # 0=raw, 1=processed
-    parent_image_hash = Column(CHAR(64), nullable=True, index=True)  # For provenance chain (processed→raw)
-    transaction_id = Column(String(36), nullable=False, index=True)  # Groups raw+processed from same capture
+    modification_level = Column(Integer, nullable=False, default=0)  # 0=raw, 1=processed
+    parent_image_hash = Column(CHAR(64), nullable=True)  # For provenance chain (processed→raw)
+    transaction_id = Column(String(36), nullable=False)  # Groups raw+processed from same capture
     manufacturer_authority_id = Column(String(100), nullable=False)  # e.g., "SIMULATED_CAMERA_001"
     camera_token_json = Column(Text, nullable=False)  # JSON-encoded CameraToken object
 
@@ -140,15 +149,24 @@ class PendingSubmission(Base):
 
     # Validation tracking
     validation_status = Column(
-        String(50),
+        Enum(
+            "pending_ma_validation",
+            "validated",
+            "rejected",
+            "validation_failed",
+            name="validation_status_enum",
+        ),
         default="pending_ma_validation",
         nullable=False,
-        index=True
-    )  # pending_ma_validation, validated, rejected, validation_failed
+    )
     validation_retry_count = Column(Integer, default=0, nullable=False)
     validation_next_retry = Column(String(50), nullable=True)  # ISO datetime string
-    received_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    sma_validated = Column(Boolean, default=False, nullable=False, index=True)
+    received_at = Column(
+        DateTime,
+        server_default=text("timezone('utc', now())"),  # naive UTC, assigned by the DB
+        nullable=False,
+    )
+    sma_validated = Column(Boolean, default=False, nullable=False)
     validation_attempted_at = Column(DateTime, nullable=True)
     validation_result = Column(String(50), nullable=True)  # PASS, FAIL, ERROR
 
@@ -157,17 +175,40 @@ class PendingSubmission(Base):
     device_signature = Column(LargeBinary, nullable=True)  # Bundle signature
 
     # Blockchain submission tracking (for crash recovery)
-    blockchain_posted = Column(Boolean, default=False, nullable=False, index=True)
+    blockchain_posted = Column(Boolean, default=False, nullable=False)
     block_number = Column(BigInteger, nullable=True)
     tx_id = Column(Integer, ForeignKey("transactions.tx_id"), nullable=True)
 
     __table_args__ = (
-        Index("idx_pending_validated", "sma_validated"),
-        Index("idx_pending_validation_status", "validation_status"),
         Index("idx_pending_transaction_id", "transaction_id"),
-        Index("idx_pending_modification_level", "modification_level"),
         Index("idx_pending_parent_hash", "parent_image_hash"),
-        Index("idx_pending_blockchain_posted", "blockchain_posted"),
+        # Rows still waiting to be posted, so the status endpoint's count
+        # stays O(pending)
+        Index(
+            "idx_pending_unposted",
+            "id",
+            postgresql_where=text(PENDING_UNPOSTED_PREDICATE),
+        ),
+        # Certificate idempotency check: (image_hash, timestamp) lookup that
+        # returns the receipt fields without touching the heap
+        Index(
+            "idx_pending_hash_timestamp",
+            "image_hash",
+            "timestamp",
+            postgresql_include=["transaction_id", "sma_validated"],
+        ),
+        # Validation worker queue: pending rows in arrival order
+        Index(
+            "idx_pending_validation_queue",
+            "received_at",
+            postgresql_where=text("validation_status = 'pending_ma_validation'"),
+        ),
+        # Batching queue: validated rows in arrival order
+        Index(
+            "idx_pending_validated_queue",
+            "received_at",
+            postgresql_where=text("sma_validated = true"),
+        ),
     )
 
 
@@ -208,7 +249,7 @@ class ModificationRecordDB(Base):
     __tablename__ = "modification_records"
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    original_image_hash = Column(CHAR(64), nullable=False, index=True)
+    original_image_hash = Column(CHAR(64), nullable=False)
     final_image_hash = Column(CHAR(64), nullable=False, unique=True, index=True)
     modification_level = Column(Integer, nullable=False)  # 0=unmodified, 1=minor, 2=heavy
     authenticated = Column(Boolean, nullable=False)  # Was original authenticated?
@@ -220,7 +261,7 @@ class ModificationRecordDB(Base):
     final_height = Column(Integer, nullable=True)
 
     # Software info
-    software_id = Column(String(255), nullable=False, index=True)
+    software_id = Column(String(255), nullable=False)
     plugin_version = Column(String(50), nullable=False)
     authority_type = Column(String(50), default="software", nullable=False)
 
@@ -234,7 +275,6 @@ class ModificationRecordDB(Base):
 
     __table_args__ = (
         Index("idx_mod_original", "original_image_hash"),
-        Index("idx_mod_final", "final_image_hash"),
         Index("idx_mod_software", "software_id"),
         Index("idx_mod_level", "modification_level"),
     )
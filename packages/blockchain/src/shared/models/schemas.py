@@ -8,6 +8,21 @@ from pydantic import BaseModel, Field, field_validator
 import re
 import base64
 
+# Compiled once; validators run on every submission
+_HEX_RE = re.compile(r'^[a-f0-9]+$', re.IGNORECASE)
+
+
+def _is_sha256_hex(v: str) -> bool:
+    """Check for a 64-character hex string (SHA-256 digest)."""
+    if len(v) != 64:
+        return False
+    try:
+        # bytes.fromhex is a C loop, cheaper than a regex match; it skips
+        # whitespace, so also require exactly 32 decoded bytes
+        return len(bytes.fromhex(v)) == 32
+    except ValueError:
+        return False
+
 
 class ImageHashEntry(BaseModel):
     """Single image hash with modification level and parent reference."""
@@ -22,7 +37,7 @@ class ImageHashEntry(BaseModel):
         """Validate SHA-256 hash format."""
         if v is None:
             return v
-        if not re.match(r'^[a-f0-9]{64}$', v, re.IGNORECASE):
+        if not _is_sha256_hex(v):
             raise ValueError("Hash must be 64 hexadecimal characters")
         return v.lower()
 
@@ -40,7 +55,7 @@ class CameraToken(BaseModel):
     @classmethod
     def validate_hex(cls, v: str) -> str:
         """Validate hexadecimal encoding."""
-        if not re.match(r'^[a-f0-9]+$', v, re.IGNORECASE):
+        if not _HEX_RE.match(v):
             raise ValueError("Must be hexadecimal string")
         return v.lower()
 
@@ -118,7 +133,7 @@ class AuthenticationBundle(BaseModel):
         """Validate SHA-256 hash format."""
         if v is None:
             return v
-        if not re.match(r'^[a-f0-9]{64}$', v, re.IGNORECASE):
+        if not _is_sha256_hex(v):
             raise ValueError("Hash must be 64 hexadecimal characters")
         return v.lower()
 
@@ -164,7 +179,7 @@ class CertificateBundle(BaseModel):
         """Validate SHA-256 hash format."""
         if v is None:
             return v
-        if not re.match(r'^[a-f0-9]{64}$', v, re.IGNORECASE):
+        if not _is_sha256_hex(v):
             raise ValueError("Hash must be 64 hexadecimal characters")
         return v.lower()
 
@@ -221,7 +236,7 @@ class CertificateValidationRequest(BaseModel):
     @classmethod
     def validate_hash(cls, v: str) -> str:
         """Validate SHA-256 hash format."""
-        if not re.match(r'^[a-f0-9]{64}$', v, re.IGNORECASE):
+        if not _is_sha256_hex(v):
             raise ValueError("Hash must be 64 hexadecimal characters")
         return v.lower()
 
@@ -261,7 +276,7 @@ class BatchTransaction(BaseModel):
     def validate_hashes(cls, v: List[str]) -> List[str]:
         """Validate all hashes are valid SHA-256."""
         for h in v:
-            if not re.match(r'^[a-f0-9]{64}$', h, re.IGNORECASE):
+            if not _is_sha256_hex(h):
                 raise ValueError(f"Invalid hash format: {h}")
         return [h.lower() for h in v]
 
@@ -294,7 +309,7 @@ class VerificationRequest(BaseModel):
     @classmethod
     def validate_hash(cls, v: str) -> str:
         """Validate SHA-256 hash format."""
-        if not re.match(r'^[a-f0-9]{64}$', v, re.IGNORECASE):
+        if not _is_sha256_hex(v):
             raise ValueError("Hash must be 64 hexadecimal characters")
         return v.lower()
 
@@ -311,6 +326,27 @@ class VerificationResponse(BaseModel):
     gps_hash: Optional[str] = None
 
 
+class BatchVerificationRequest(BaseModel):
+    """Request to verify several image hashes at once."""
+
+    image_hashes: List[str] = Field(..., min_length=1, max_length=100)
+
+    @field_validator("image_hashes")
+    @classmethod
+    def validate_hashes(cls, v: List[str]) -> List[str]:
+        """Validate all hashes are valid SHA-256."""
+        for h in v:
+            if not _is_sha256_hex(h):
+                raise ValueError(f"Invalid hash format: {h}")
+        return [h.lower() for h in v]
+
+
+class BatchVerificationResponse(BaseModel):
+    """Verification results, in request order."""
+
+    results: List[VerificationResponse]
+
+
 class NodeStatus(BaseModel):
     """Node health and statistics."""
 
@@ -366,7 +402,7 @@ class ModificationRecord(BaseModel):
     @classmethod
     def validate_hash(cls, v: str) -> str:
         """Validate SHA-256 hash format."""
-        if not re.match(r'^[a-f0-9]{64}$', v, re.IGNORECASE):
+        if not _is_sha256_hex(v):
             raise ValueError("Hash must be 64 hexadecimal characters")
         return v.lower()
 
@@ -10,7 +10,7 @@ and provides provenance chain verification.
 
 from fastapi import APIRouter, HTTPException, status, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import literal, or_, select
 from typing import Optional
 import httpx
 import logging
@@ -22,7 +22,7 @@ from ...shared.models.schemas import (
     ProvenanceChain,
     ProvenanceItem,
 )
-from ...shared.database import get_db
+from ...shared.database import get_db, ModificationRecordDB
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api/v1", tags=["modifications"])
@@ -87,7 +87,6 @@ async def submit_modification_record(
 
         db.add(mod_record)
         await db.commit()
-        await db.refresh(mod_record)
 
         logger.info(
             f"Stored modification record: {record.software_id} "
@@ -136,59 +135,69 @@ async def get_provenance_chain(
         logger.info(f"Querying provenance chain for: {image_hash[:16]}...")
 
         chain = []
-        current_hash = image_hash
         verified = False
 
-        # Trace backwards through modification records
+        # Trace backwards through modification records in one recursive
+        # query (final_image_hash is unique, so the chain is linear)
         max_depth = 10  # Prevent infinite loops
-        depth = 0
-
-        while depth < max_depth:
-            # Check if this hash is a modified image
-            mod_result = await db.execute(
-                select(ModificationRecordDB).where(
-                    ModificationRecordDB.final_image_hash == current_hash
+        walk = (
+            select(
+                ModificationRecordDB.id,
+                ModificationRecordDB.original_image_hash,
+                literal(1).label("depth"),
+            )
+            .where(ModificationRecordDB.final_image_hash == image_hash)
+            .cte("provenance_walk", recursive=True)
+        )
+        walk = walk.union_all(
+            select(
+                ModificationRecordDB.id,
+                ModificationRecordDB.original_image_hash,
+                walk.c.depth + 1,
+            )
+            .join(walk, ModificationRecordDB.final_image_hash == walk.c.original_image_hash)
+            .where(walk.c.depth < max_depth)
+        )
+        mod_result = await db.execute(
+            select(ModificationRecordDB)
+            .join(walk, ModificationRecordDB.id == walk.c.id)
+            .order_by(walk.c.depth.desc())
+        )
+        mod_records = mod_result.scalars().all()
+
+        # Oldest modification first
+        for mod_record in mod_records:
+            chain.append(ProvenanceItem(
+                hash=mod_record.final_image_hash,
+                type="modification",
+                timestamp=mod_record.exported_at.isoformat(),
+                authority_type=mod_record.authority_type,
+                authority_id=mod_record.software_id,
+                modification_level=mod_record.modification_level,
+                software_version=mod_record.plugin_version,
+            ))
+
+        if len(mod_records) < max_depth:
+            # No more modifications, check if the root is an authenticated capture
+            root_hash = mod_records[0].original_image_hash if mod_records else image_hash
+            capture_result = await db.execute(
+                select(ConfirmedHash).where(
+                    ConfirmedHash.image_hash == root_hash
                 )
             )
-            mod_record = mod_result.scalars().first()
+            capture = capture_result.scalars().first()
 
-            if mod_record:
-                # Add modification to chain
+            if capture:
+                # Found authenticated capture
                 chain.insert(0, ProvenanceItem(
-                    hash=mod_record.final_image_hash,
-                    type="modification",
-                    timestamp=mod_record.exported_at.isoformat(),
-                    authority_type=mod_record.authority_type,
-                    authority_id=mod_record.software_id,
-                    modification_level=mod_record.modification_level,
-                    software_version=mod_record.plugin_version,
+                    hash=capture.image_hash,
+                    type="capture",
+                    timestamp=datetime.fromtimestamp(capture.timestamp).isoformat(),
+                    authority_type="manufacturer",
+                    authority_id=capture.submission_server or "unknown",
+                    modification_level=0,
                 ))
-
-                # Continue tracing to original
-                current_hash = mod_record.original_image_hash
-                depth += 1
-            else:
-                # No more modifications, check if this is an authenticated capture
-                capture_result = await db.execute(
-                    select(ConfirmedHash).where(
-                        ConfirmedHash.image_hash == current_hash
-                    )
-                )
-                capture = capture_result.scalars().first()
-
-                if capture:
-                    # Found authenticated capture
-                    chain.insert(0, ProvenanceItem(
-                        hash=capture.image_hash,
-                        type="capture",
-                        timestamp=datetime.fromtimestamp(capture.timestamp).isoformat(),
-                        authority_type="manufacturer",
-                        authority_id=capture.submission_server or "unknown",
-                        modification_level=0,
-                    ))
-                    verified = True
-
-                break  # End of chain
+                verified = True
 
         if not chain:
             # No provenance found
@@ -230,21 +239,19 @@ async def get_modification_history(
         List of modification records
     """
     try:
-        # Query as original hash
-        original_query = await db.execute(
+        # Fetch records with the hash on either side in one query
+        result = await db.execute(
             select(ModificationRecordDB).where(
-                ModificationRecordDB.original_image_hash == image_hash
+                or_(
+                    ModificationRecordDB.original_image_hash == image_hash,
+                    ModificationRecordDB.final_image_hash == image_hash,
+                )
             )
         )
-        as_original = original_query.scalars().all()
+        records = result.scalars().all()
 
-        # Query as final hash
-        final_query = await db.execute(
-            select(ModificationRecordDB).where(
-                ModificationRecordDB.final_image_hash == image_hash
-            )
-        )
-        as_final = final_query.scalars().all()
+        as_original = [r for r in records if r.original_image_hash == image_hash]
+        as_final = [r for r in records if r.final_image_hash == image_hash]
 
         return {
             "image_hash": image_hash,
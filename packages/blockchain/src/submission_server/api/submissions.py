@@ -4,15 +4,18 @@
 """Submission Server API for camera submissions."""
 
 import logging
+import os
+import time
 import uuid
-import json
 from datetime import datetime
-from typing import Optional
+from typing import Awaitable, Callable, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status
+import orjson
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
+from sqlalchemy import insert, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.shared.database.connection import get_db
+from src.shared.database.connection import get_async_db, get_db
 from src.shared.database.models import PendingSubmission
 from src.shared.models.schemas import (
     AuthenticationBundle,
@@ -26,12 +29,57 @@ from src.submission_server.blockchain.blockchain_client import blockchain_client
 
 logger = logging.getLogger(__name__)
 
+
+def _new_transaction_id() -> str:
+    """
+    Generate a time-ordered UUIDv7 string for a new transaction.
+
+    transaction_id is indexed; random UUIDv4 values land on random leaf pages,
+    while UUIDv7 keys (48-bit millisecond timestamp first) append near the
+    right edge of the B-tree.
+    """
+    value = (time.time_ns() // 1_000_000) << 80 | int.from_bytes(os.urandom(10), "big")
+    # Stamp version 7 and the RFC 4122 variant over the random bits
+    value = value & ~(0xF << 76) | 0x7 << 76
+    value = value & ~(0x3 << 62) | 0x2 << 62
+    return str(uuid.UUID(int=value))
+
+
 router = APIRouter(prefix="/api/v1", tags=["submission_server"])
 
 
+async def run_validation_in_background(
+    receipt_id: str,
+    validate: Callable[..., Awaitable[None]],
+    submission_id: Optional[int] = None,
+    **kwargs,
+) -> None:
+    """
+    Run an inline validation helper after the 202 response has been sent.
+
+    The request-scoped session is closed by then, so the helper gets its own
+    session; if submission_id is given, the submission is reloaded in it and
+    passed as the helper's ``submission`` argument.
+
+    Args:
+        receipt_id: Receipt/transaction ID, for logging
+        validate: One of the validate_*_inline helpers
+        submission_id: Primary key of the submission to reload (optional)
+        **kwargs: Remaining arguments for the helper
+    """
+    try:
+        async with get_async_db() as db:
+            if submission_id is not None:
+                kwargs["submission"] = await db.get(PendingSubmission, submission_id)
+            await validate(db=db, **kwargs)
+    except Exception as e:
+        logger.error(f"Validation error for {receipt_id}: {e}")
+
+
 @router.post("/submit", response_model=SubmissionResponse, status_code=status.HTTP_202_ACCEPTED)
 async def submit_camera_bundle(
     submission: CameraSubmission,
+    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db),
 ) -> SubmissionResponse:
     """
@@ -42,12 +90,13 @@ async def submit_camera_bundle(
 
     Args:
         submission: Camera submission with image_hashes array and structured camera_token
+        background_tasks: Runs SMA validation after the response is sent
         db: Database session
 
     Returns:
         Receipt with transaction ID and status
     """
-    transaction_id = str(uuid.uuid4())
+    transaction_id = _new_transaction_id()
 
     logger.info("="*80)
     logger.info(f"📨 CAMERA SUBMISSION RECEIVED (Transaction ID: {transaction_id})")
@@ -70,45 +119,44 @@ async def submit_camera_bundle(
     logger.info(f"Timestamp: {submission.timestamp}")
     logger.info("="*80)
 
-    # Store all image hashes with shared transaction_id
-    submission_records = []
-    for entry in submission.image_hashes:
-        pending = PendingSubmission(
-            image_hash=entry.image_hash,
-            modification_level=entry.modification_level,
-            parent_image_hash=entry.parent_image_hash,
-            transaction_id=transaction_id,
-            manufacturer_authority_id=submission.manufacturer_cert.authority_id,
-            camera_token_json=submission.camera_token.model_dump_json(),
-            timestamp=submission.timestamp,
-            sma_validated=False,
-            # Legacy fields set to None
-            encrypted_token=None,
-            table_references=None,
-            key_indices=None,
-            device_signature=None,
-        )
-        db.add(pending)
-        submission_records.append(pending)
+    # Store all image hashes with shared transaction_id in one Core INSERT
+    # (no ORM objects are needed; validation runs against the table).
+    # received_at is assigned by the database.
+    manufacturer_authority_id = submission.manufacturer_cert.authority_id
+    camera_token_json = submission.camera_token.model_dump_json()
+    rows = [
+        {
+            "image_hash": entry.image_hash,
+            "modification_level": entry.modification_level,
+            "parent_image_hash": entry.parent_image_hash,
+            "transaction_id": transaction_id,
+            "manufacturer_authority_id": manufacturer_authority_id,
+            "camera_token_json": camera_token_json,
+            "timestamp": submission.timestamp,
+            "sma_validated": False,
+            "device_signature": None,
+        }
+        for entry in submission.image_hashes
+    ]
+    await db.execute(insert(PendingSubmission), rows)
 
     await db.commit()
 
     logger.info(
         f"Camera submission {transaction_id} queued: "
-        f"hashes={[s.image_hash[:16] + '...' for s in submission_records]}"
+        f"hashes={[row['image_hash'][:16] + '...' for row in rows]}"
     )
 
     # Validate camera token with SMA (validates once for all hashes in transaction)
-    try:
-        await validate_camera_transaction_inline(
-            transaction_id=transaction_id,
-            camera_token=submission.camera_token,
-            manufacturer_authority_id=submission.manufacturer_cert.authority_id,
-            validation_endpoint=submission.manufacturer_cert.validation_endpoint,
-            db=db,
-        )
-    except Exception as e:
-        logger.error(f"Validation error for transaction {transaction_id}: {e}")
+    background_tasks.add_task(
+        run_validation_in_background,
+        transaction_id,
+        validate_camera_transaction_inline,
+        transaction_id=transaction_id,
+        camera_token=submission.camera_token,
+        manufacturer_authority_id=manufacturer_authority_id,
+        validation_endpoint=submission.manufacturer_cert.validation_endpoint,
+    )
 
     return SubmissionResponse(
         receipt_id=transaction_id,
@@ -157,8 +205,6 @@ async def validate_camera_transaction_inline(
     logger.info("="*80)
 
     # Update all submissions in this transaction
-    from sqlalchemy import update
-
     stmt = (
         update(PendingSubmission)
         .where(PendingSubmission.transaction_id == transaction_id)
@@ -183,8 +229,6 @@ async def validate_camera_transaction_inline(
         logger.info("✓"*40 + "\n")
 
         # Submit validated hashes to blockchain immediately (no batching)
-        from sqlalchemy import select
-
         stmt = select(PendingSubmission).where(
             PendingSubmission.transaction_id == transaction_id
         )
@@ -230,6 +274,7 @@ async def validate_camera_transaction_inline(
 @router.post("/submit-legacy", response_model=SubmissionResponse, status_code=status.HTTP_202_ACCEPTED)
 async def submit_authentication_bundle_legacy(
     bundle: AuthenticationBundle,
+    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db),
 ) -> SubmissionResponse:
     """
@@ -240,12 +285,13 @@ async def submit_authentication_bundle_legacy(
 
     Args:
         bundle: Authentication bundle with image hash and encrypted camera token
+        background_tasks: Runs SMA validation after the response is sent
         db: Database session
 
     Returns:
         Receipt with submission ID and status
     """
-    receipt_id = str(uuid.uuid4())
+    receipt_id = _new_transaction_id()
 
     logger.info(
         f"Received submission {receipt_id}: hash={bundle.image_hash[:16]}..., "
@@ -253,7 +299,6 @@ async def submit_authentication_bundle_legacy(
     )
 
     # Serialize camera token to JSON
-    import json
     camera_token_data = {
         "encrypted_nuc_token": bundle.encrypted_nuc_token.hex(),
         "table_references": bundle.table_references,
@@ -263,7 +308,7 @@ async def submit_authentication_bundle_legacy(
     # Create pending submission record
     submission = PendingSubmission(
         image_hash=bundle.image_hash,
-        camera_token_json=json.dumps(camera_token_data),
+        camera_token_json=orjson.dumps(camera_token_data).decode(),
         modification_level=0,  # Legacy endpoint assumes raw
         parent_image_hash=None,
         transaction_id=receipt_id,  # Use receipt as transaction ID
@@ -279,12 +324,13 @@ async def submit_authentication_bundle_legacy(
 
     logger.info(f"Submission {receipt_id} queued for validation")
 
-    # Trigger background validation (in real system, this would be async worker)
-    # For Phase 1, we validate inline
-    try:
-        await validate_submission_inline(submission, db)
-    except Exception as e:
-        logger.error(f"Validation error for {receipt_id}: {e}")
+    # Validate after the response is sent (in real system, this would be async worker)
+    background_tasks.add_task(
+        run_validation_in_background,
+        receipt_id,
+        validate_submission_inline,
+        submission_id=submission.id,
+    )
 
     return SubmissionResponse(
         receipt_id=receipt_id,
@@ -309,8 +355,7 @@ async def validate_submission_inline(
     logger.info(f"Validating submission ID={submission.id} with SMA")
 
     # Parse camera token JSON
-    import json
-    token_data = json.loads(submission.camera_token_json)
+    token_data = orjson.loads(submission.camera_token_json)
     encrypted_token = bytes.fromhex(token_data["encrypted_nuc_token"])
     table_references = token_data["table_references"]
     key_indices = token_data["key_indices"]
@@ -370,6 +415,7 @@ async def validate_submission_inline(
 @router.post("/submit-cert", response_model=SubmissionResponse, status_code=status.HTTP_202_ACCEPTED)
 async def submit_certificate_bundle(
     bundle: CertificateBundle,
+    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db),
 ) -> SubmissionResponse:
     """
@@ -382,20 +428,24 @@ async def submit_certificate_bundle(
 
     Args:
         bundle: Certificate bundle with image hash, certificate, timestamp, and signature
+        background_tasks: Runs SMA validation after the response is sent
         db: Database session
 
     Returns:
         Receipt with submission ID and status
     """
     # Check for duplicate submission (idempotency)
-    from sqlalchemy import select
-
-    stmt = select(PendingSubmission).where(
+    # Only the receipt fields are needed; stop at the first match
+    stmt = select(
+        PendingSubmission.id,
+        PendingSubmission.transaction_id,
+        PendingSubmission.sma_validated,
+    ).where(
         PendingSubmission.image_hash == bundle.image_hash,
         PendingSubmission.timestamp == bundle.timestamp
-    )
+    ).limit(1)
     result = await db.execute(stmt)
-    existing = result.scalar_one_or_none()
+    existing = result.first()
 
     if existing:
         logger.info(
@@ -408,7 +458,7 @@ async def submit_certificate_bundle(
             message="Duplicate submission - returning existing receipt",
         )
 
-    receipt_id = str(uuid.uuid4())
+    receipt_id = _new_transaction_id()
 
     logger.info(
         f"Received certificate submission {receipt_id}: hash={bundle.image_hash[:16]}..., "
@@ -433,26 +483,23 @@ async def submit_certificate_bundle(
     )
 
     db.add(submission)
-    await db.commit()
-    await db.refresh(submission)  # Get the auto-generated ID
+    await db.commit()  # id is populated by the INSERT; sessions don't expire on commit
 
     logger.info(f"Certificate submission {receipt_id} queued for validation")
 
-    # Try immediate validation (fast path) - non-blocking
+    # Try immediate validation (fast path) once the response is sent
     # If this fails, background worker will retry
-    try:
-        await validate_certificate_submission_inline(
-            submission,
-            bundle.camera_cert,
-            bundle.image_hash,
-            bundle.timestamp,
-            getattr(bundle, 'owner_hash', bundle.gps_hash),
-            bundle.bundle_signature,
-            db
-        )
-    except Exception as e:
-        logger.warning(f"Immediate validation failed for {receipt_id}, will retry in background: {e}")
-        # Don't raise - let background worker handle it
+    background_tasks.add_task(
+        run_validation_in_background,
+        receipt_id,
+        validate_certificate_submission_inline,
+        submission_id=submission.id,
+        camera_cert=bundle.camera_cert,
+        image_hash=bundle.image_hash,
+        timestamp=bundle.timestamp,
+        gps_hash=getattr(bundle, 'owner_hash', bundle.gps_hash),
+        bundle_signature=bundle.bundle_signature,
+    )
 
     return SubmissionResponse(
         receipt_id=receipt_id,
@@ -74,6 +74,20 @@ class BlockchainClient:
         """
         self.endpoint = blockchain_endpoint
         self.timeout = timeout
+        self._client: Optional[httpx.AsyncClient] = None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Shared HTTP client, so connections to the node are kept alive and reused."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(timeout=self.timeout)
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP client (called on application shutdown)."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
 
     async def submit_hash(
         self,
@@ -106,40 +120,39 @@ class BlockchainClient:
         rounded_timestamp = round_timestamp_to_minute(timestamp)
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(
-                    f"{self.endpoint}/api/v1/blockchain/submit",
-                    json={
-                        "image_hash": image_hash,
-                        "timestamp": rounded_timestamp,
-                        "submission_server_id": submission_server_id,
-                        "modification_level": modification_level,
-                        "parent_image_hash": parent_image_hash,
-                        "gps_hash": gps_hash,
-                    },
-                )
+            response = await self.client.post(
+                f"{self.endpoint}/api/v1/blockchain/submit",
+                json={
+                    "image_hash": image_hash,
+                    "timestamp": rounded_timestamp,
+                    "submission_server_id": submission_server_id,
+                    "modification_level": modification_level,
+                    "parent_image_hash": parent_image_hash,
+                    "gps_hash": gps_hash,
+                },
+            )
 
-                if response.status_code == 200:
-                    data = response.json()
-                    logger.info(
-                        f"Hash {image_hash[:16]}... submitted to blockchain: "
-                        f"tx_id={data.get('tx_id')}, block_height={data.get('block_height')}"
-                    )
-                    return BlockchainSubmissionResponse(
-                        success=True,
-                        tx_id=data.get("tx_id"),
-                        block_height=data.get("block_height"),
-                        message=data.get("message"),
-                    )
-                else:
-                    logger.error(
-                        f"Blockchain submission failed for {image_hash[:16]}...: "
-                        f"{response.status_code} - {response.text}"
-                    )
-                    return BlockchainSubmissionResponse(
-                        success=False,
-                        message=f"HTTP {response.status_code}: {response.text}",
-                    )
+            if response.status_code == 200:
+                data = response.json()
+                logger.info(
+                    f"Hash {image_hash[:16]}... submitted to blockchain: "
+                    f"tx_id={data.get('tx_id')}, block_height={data.get('block_height')}"
+                )
+                return BlockchainSubmissionResponse(
+                    success=True,
+                    tx_id=data.get("tx_id"),
+                    block_height=data.get("block_height"),
+                    message=data.get("message"),
+                )
+            else:
+                logger.error(
+                    f"Blockchain submission failed for {image_hash[:16]}...: "
+                    f"{response.status_code} - {response.text}"
+                )
+                return BlockchainSubmissionResponse(
+                    success=False,
+                    message=f"HTTP {response.status_code}: {response.text}",
+                )
 
         except httpx.TimeoutException:
             logger.error(f"Blockchain submission timeout for {image_hash[:16]}...")
@@ -3,10 +3,12 @@
 
 """SMA (Simulated Manufacturer Authority) validation client."""
 
+import asyncio
 import logging
-from typing import Optional, TYPE_CHECKING
+from typing import Awaitable, Callable, Dict, Optional, Tuple, TYPE_CHECKING
 
 import httpx
+import orjson
 
 from src.shared.config import settings
 from src.shared.models.schemas import SMAValidationRequest, SMAValidationResponse
@@ -34,6 +36,50 @@ class SMAClient:
         """
         self.endpoint = endpoint or settings.sma_validation_endpoint
         self.timeout = timeout or settings.sma_request_timeout
+        self._client: Optional[httpx.AsyncClient] = None
+        # Validations currently awaiting the SMA, keyed by request contents
+        self._in_flight: Dict[Tuple, "asyncio.Future[SMAValidationResponse]"] = {}
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Shared HTTP client, so connections to the SMA are kept alive and reused."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(timeout=self.timeout)
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP client (called on application shutdown)."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def _coalesce(
+        self,
+        key: Tuple,
+        call: Callable[[], Awaitable[SMAValidationResponse]],
+    ) -> SMAValidationResponse:
+        """
+        Share one in-flight SMA request between identical concurrent validations.
+
+        The first caller starts the request; callers with the same key that
+        arrive before it completes await the same result instead of sending
+        another request (e.g. a retried camera upload, or the inline fast
+        path and the validation worker picking up the same submission).
+
+        Args:
+            key: Hashable request contents
+            call: Starts the actual SMA request
+
+        Returns:
+            Validation response shared by all callers with this key
+        """
+        future = self._in_flight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(call())
+            self._in_flight[key] = future
+            future.add_done_callback(lambda _: self._in_flight.pop(key, None))
+        # Shield so one cancelled caller does not cancel the shared request
+        return await asyncio.shield(future)
 
     async def validate_camera_token(
         self,
@@ -43,6 +89,8 @@ class SMAClient:
         """
         Validate structured camera token with SMA (Phase 1 - NEW FORMAT).
 
+        Identical concurrent validations share one request (see _coalesce).
+
         IMPORTANT: SMA never sees the image hash. Only the camera token
         is sent for validation.
 
@@ -53,28 +101,47 @@ class SMAClient:
         Returns:
             Validation response with PASS/FAIL
         """
+        key = (
+            "camera_token",
+            camera_token.ciphertext,
+            camera_token.auth_tag,
+            camera_token.nonce,
+            camera_token.table_id,
+            camera_token.key_index,
+            manufacturer_authority_id,
+        )
+        return await self._coalesce(
+            key,
+            lambda: self._validate_camera_token(camera_token, manufacturer_authority_id),
+        )
+
+    async def _validate_camera_token(
+        self,
+        camera_token: "CameraToken",
+        manufacturer_authority_id: str,
+    ) -> SMAValidationResponse:
+        """Send a camera token validation request to the SMA."""
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(
-                    self.endpoint,
-                    json={
-                        "camera_token": {
-                            "ciphertext": camera_token.ciphertext,
-                            "auth_tag": camera_token.auth_tag,
-                            "nonce": camera_token.nonce,
-                            "table_id": camera_token.table_id,
-                            "key_index": camera_token.key_index,
-                        },
-                        "manufacturer_authority_id": manufacturer_authority_id,
+            response = await self.client.post(
+                self.endpoint,
+                json={
+                    "camera_token": {
+                        "ciphertext": camera_token.ciphertext,
+                        "auth_tag": camera_token.auth_tag,
+                        "nonce": camera_token.nonce,
+                        "table_id": camera_token.table_id,
+                        "key_index": camera_token.key_index,
                     },
-                )
-                response.raise_for_status()
+                    "manufacturer_authority_id": manufacturer_authority_id,
+                },
+            )
+            response.raise_for_status()
 
-                data = response.json()
-                return SMAValidationResponse(
-                    valid=data.get("valid", False),
-                    message=data.get("message"),
-                )
+            data = orjson.loads(response.content)
+            return SMAValidationResponse(
+                valid=data.get("valid", False),
+                message=data.get("message"),
+            )
 
         except httpx.TimeoutException:
             logger.error(f"SMA camera token validation timeout after {self.timeout}s")
@@ -127,22 +194,21 @@ class SMAClient:
         )
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(
-                    self.endpoint,
-                    json={
-                        "ciphertext": request.encrypted_token.hex(),
-                        "table_references": request.table_references,
-                        "key_indices": request.key_indices,
-                    },
-                )
-                response.raise_for_status()
+            response = await self.client.post(
+                self.endpoint,
+                json={
+                    "ciphertext": request.encrypted_token.hex(),
+                    "table_references": request.table_references,
+                    "key_indices": request.key_indices,
+                },
+            )
+            response.raise_for_status()
 
-                data = response.json()
-                return SMAValidationResponse(
-                    valid=data.get("valid", False),
-                    message=data.get("message"),
-                )
+            data = orjson.loads(response.content)
+            return SMAValidationResponse(
+                valid=data.get("valid", False),
+                message=data.get("message"),
+            )
 
         except httpx.TimeoutException:
             logger.error(f"SMA validation timeout after {self.timeout}s")
@@ -185,6 +251,8 @@ class SMAClient:
 
         PRIVACY: SMA uses image_hash only for signature verification, not content inspection.
 
+        Identical concurrent validations share one request (see _coalesce).
+
         Args:
             camera_cert: Base64-encoded PEM certificate
             image_hash: SHA-256 image hash
@@ -195,29 +263,45 @@ class SMAClient:
         Returns:
             Validation response with PASS/FAIL
         """
+        key = ("certificate_bundle", camera_cert, image_hash, timestamp, gps_hash, bundle_signature)
+        return await self._coalesce(
+            key,
+            lambda: self._validate_certificate_bundle(
+                camera_cert, image_hash, timestamp, gps_hash, bundle_signature
+            ),
+        )
+
+    async def _validate_certificate_bundle(
+        self,
+        camera_cert: str,
+        image_hash: str,
+        timestamp: int,
+        gps_hash: Optional[str],
+        bundle_signature: str,
+    ) -> SMAValidationResponse:
+        """Send a certificate bundle validation request to the SMA."""
         # Build SMA certificate validation endpoint
         # If endpoint is http://localhost:8001/validate, use http://localhost:8001/validate-cert
         cert_endpoint = self.endpoint.replace("/validate", "/validate-cert")
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(
-                    cert_endpoint,
-                    json={
-                        "camera_cert": camera_cert,
-                        "image_hash": image_hash,
-                        "timestamp": timestamp,
-                        "gps_hash": gps_hash,
-                        "bundle_signature": bundle_signature,
-                    },
-                )
-                response.raise_for_status()
-
-                data = response.json()
-                return SMAValidationResponse(
-                    valid=data.get("valid", False),
-                    message=data.get("message"),
-                )
+            response = await self.client.post(
+                cert_endpoint,
+                json={
+                    "camera_cert": camera_cert,
+                    "image_hash": image_hash,
+                    "timestamp": timestamp,
+                    "gps_hash": gps_hash,
+                    "bundle_signature": bundle_signature,
+                },
+            )
+            response.raise_for_status()
+
+            data = orjson.loads(response.content)
+            return SMAValidationResponse(
+                valid=data.get("valid", False),
+                message=data.get("message"),
+            )
 
         except httpx.TimeoutException:
             logger.error(f"SMA certificate validation timeout after {self.timeout}s")
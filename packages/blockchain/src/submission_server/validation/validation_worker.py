@@ -85,7 +85,7 @@ class ValidationWorker:
                 stmt = select(PendingSubmission).where(
                     PendingSubmission.validation_status == "pending_ma_validation",
                     PendingSubmission.validation_retry_count < 5  # Max 5 total attempts
-                )
+                ).order_by(PendingSubmission.received_at)
                 result = await session.execute(stmt)
                 pending = result.scalars().all()
 
@@ -94,8 +94,10 @@ class ValidationWorker:
 
                 logger.info(f"Processing {len(pending)} pending validations")
 
+                # One clock read per batch for the retry-delay checks
+                now = datetime.utcnow()
                 for submission in pending:
-                    await self._validate_submission(submission, session)
+                    await self._validate_submission(submission, session, now)
 
                 await session.commit()
 
@@ -105,7 +107,8 @@ class ValidationWorker:
     async def _validate_submission(
         self,
         submission: PendingSubmission,
-        session: AsyncSession
+        session: AsyncSession,
+        now: Optional[datetime] = None
     ):
         """
         Validate a single submission with MA.
@@ -113,11 +116,12 @@ class ValidationWorker:
         Args:
             submission: Pending submission to validate
             session: Database session
+            now: Batch start time used for the retry-delay check
         """
         # Check if we should retry yet (respect retry delay)
         if submission.validation_next_retry:
             next_retry = datetime.fromisoformat(submission.validation_next_retry)
-            if datetime.utcnow() < next_retry:
+            if (now or datetime.utcnow()) < next_retry:
                 logger.debug(
                     f"Skipping submission {submission.id} - "
                     f"next retry at {next_retry}"
@@ -164,6 +164,20 @@ class TestModels:
         assert response.verified is False
         assert response.timestamp is None
 
+    def test_batch_verification_request(self):
+        """Test BatchVerificationRequest normalizes and validates hashes."""
+        from src.shared.models.schemas import BatchVerificationRequest
+        from pydantic import ValidationError
+
+        request = BatchVerificationRequest(image_hashes=["A" * 64, "b" * 64])
+        assert request.image_hashes == ["a" * 64, "b" * 64]
+
+        with pytest.raises(ValidationError):
+            BatchVerificationRequest(image_hashes=["invalid"])
+
+        with pytest.raises(ValidationError):
+            BatchVerificationRequest(image_hashes=[])
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
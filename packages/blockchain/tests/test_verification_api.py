@@ -0,0 +1,119 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# Copyright (C) 2024-2026 The Birthmark Standard Foundation
+
+"""Tests for the public verification API endpoints."""
+
+import pytest
+
+pytest.importorskip("aiosqlite")
+
+import httpx
+from fastapi import FastAPI
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from src.node.api import verification
+from src.shared.database.connection import Base, get_db
+from src.shared.database.models import Block, ImageHash, Transaction
+
+RAW_HASH = "a" * 64
+PROCESSED_HASH = "c" * 64
+MISSING_HASH = "b" * 64
+
+
+@pytest.fixture
+async def client():
+    """HTTP client for the verification router backed by an in-memory database."""
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+
+    async with session_factory() as db:
+        db.add(Block(
+            block_height=1,
+            block_hash="1" * 64,
+            previous_hash="0" * 64,
+            timestamp=1700000000,
+            validator_id="test_validator",
+            transaction_count=1,
+            signature="sig",
+        ))
+        db.add(Transaction(
+            tx_id=1,
+            tx_hash="2" * 64,
+            block_height=1,
+            submission_server_id="test_server",
+            batch_size=2,
+            signature="sig",
+        ))
+        db.add_all([
+            ImageHash(image_hash=RAW_HASH, tx_id=1, block_height=1, timestamp=1700000001),
+            ImageHash(
+                image_hash=PROCESSED_HASH,
+                tx_id=1,
+                block_height=1,
+                timestamp=1700000002,
+                parent_image_hash=RAW_HASH,
+                modification_level=1,
+            ),
+        ])
+        await db.commit()
+
+    async def override_get_db():
+        async with session_factory() as session:
+            yield session
+
+    app = FastAPI()
+    app.include_router(verification.router)
+    app.dependency_overrides[get_db] = override_get_db
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as http_client:
+        yield http_client
+
+    await engine.dispose()
+
+
+class TestBatchVerification:
+    """Tests for POST /api/v1/verify/batch."""
+
+    async def test_mixed_found_and_missing_in_request_order(self, client):
+        """Found and missing hashes are reported in the order requested."""
+        response = await client.post(
+            "/api/v1/verify/batch",
+            json={"image_hashes": [PROCESSED_HASH, MISSING_HASH, RAW_HASH.upper()]},
+        )
+
+        assert response.status_code == 200
+        results = response.json()["results"]
+        assert [r["image_hash"] for r in results] == [PROCESSED_HASH, MISSING_HASH, RAW_HASH]
+        assert [r["verified"] for r in results] == [True, False, True]
+
+        assert results[0]["block_height"] == 1
+        assert results[0]["timestamp"] == 1700000002
+        assert results[0]["aggregator"] == "test_server"
+        assert results[1]["block_height"] is None
+        assert results[2]["timestamp"] == 1700000001
+
+    async def test_empty_list_rejected(self, client):
+        """An empty hash list is a validation error."""
+        response = await client.post("/api/v1/verify/batch", json={"image_hashes": []})
+
+        assert response.status_code == 422
+
+    async def test_over_limit_rejected(self, client):
+        """More than 100 hashes is a validation error."""
+        hashes = [f"{i:064x}" for i in range(101)]
+        response = await client.post("/api/v1/verify/batch", json={"image_hashes": hashes})
+
+        assert response.status_code == 422
+
+    async def test_limit_accepted(self, client):
+        """Exactly 100 hashes is accepted and answered one-for-one."""
+        hashes = [f"{i:064x}" for i in range(99)] + [RAW_HASH]
+        response = await client.post("/api/v1/verify/batch", json={"image_hashes": hashes})
+
+        assert response.status_code == 200
+        results = response.json()["results"]
+        assert len(results) == 100
+        assert [r["verified"] for r in results] == [False] * 99 + [True]
@@ -75,13 +75,13 @@ ISP_PARAMETER_LIMITS = {
     }
 }
 
-# Supported Metric Versions
-SUPPORTED_METRIC_VERSIONS = ["v2.0"]
+# Supported Metric Versions (sets: checked on every ISP validation)
+SUPPORTED_METRIC_VERSIONS = frozenset({"v2.0"})
 
 # Supported Shooting Modes by Device Family
 SUPPORTED_SHOOTING_MODES = {
-    "RASPBERRY_PI_HQ": ["standard", "vivid", "neutral"],
-    "IOS_DEVICE": ["standard", "portrait", "night", "vivid"]
+    "RASPBERRY_PI_HQ": frozenset({"standard", "vivid", "neutral"}),
+    "IOS_DEVICE": frozenset({"standard", "portrait", "night", "vivid"}),
 }
 
 def get_variance_threshold(device_family: str, shooting_mode: str = "standard") -> float:
@@ -182,6 +182,4 @@ def is_metric_version_supported(version: str) -> bool:
 
 def is_shooting_mode_supported(device_family: str, shooting_mode: str) -> bool:
     """Check if shooting mode is supported for device family."""
-    if device_family not in SUPPORTED_SHOOTING_MODES:
-        return False
-    return shooting_mode in SUPPORTED_SHOOTING_MODES[device_family]
+    return shooting_mode in SUPPORTED_SHOOTING_MODES.get(device_family, ())
@@ -141,6 +141,9 @@ class DeviceRegistry:
         """
         self.storage_path = storage_path
         self._registrations: Dict[str, DeviceRegistration] = {}
+        # Lookup indexes used on the validation path (first registration wins)
+        self._by_nuc_hash: Dict[str, DeviceRegistration] = {}
+        self._by_secret: Dict[str, DeviceRegistration] = {}
 
         if storage_path and storage_path.exists():
             self.load_from_file(storage_path)
@@ -164,6 +167,14 @@ class DeviceRegistry:
 
         # Store registration
         self._registrations[registration.device_serial] = registration
+        self._index_registration(registration)
+
+    def _index_registration(self, registration: DeviceRegistration) -> None:
+        """Add a registration to the NUC hash and device secret indexes."""
+        if registration.nuc_hash:
+            self._by_nuc_hash.setdefault(registration.nuc_hash, registration)
+        if registration.device_secret:
+            self._by_secret.setdefault(registration.device_secret, registration)
 
     def get_device(self, device_serial: str) -> Optional[DeviceRegistration]:
         """
@@ -189,10 +200,7 @@ class DeviceRegistry:
         Returns:
             DeviceRegistration or None if not found
         """
-        for registration in self._registrations.values():
-            if registration.nuc_hash and registration.nuc_hash == nuc_hash:
-                return registration
-        return None
+        return self._by_nuc_hash.get(nuc_hash)
 
     def get_device_by_secret(self, device_secret: str) -> Optional[DeviceRegistration]:
         """
@@ -206,10 +214,7 @@ class DeviceRegistry:
         Returns:
             DeviceRegistration or None if not found
         """
-        for registration in self._registrations.values():
-            if registration.device_secret == device_secret:
-                return registration
-        return None
+        return self._by_secret.get(device_secret)
 
     def blacklist_device(
         self,
@@ -380,6 +385,10 @@ class DeviceRegistry:
             reg_data["device_serial"]: DeviceRegistration.from_dict(reg_data)
             for reg_data in data["devices"]
         }
+        self._by_nuc_hash = {}
+        self._by_secret = {}
+        for registration in self._registrations.values():
+            self._index_registration(registration)
 
     def get_statistics(self) -> dict:
         """
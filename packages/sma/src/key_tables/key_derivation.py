@@ -14,6 +14,8 @@ The key derivation scheme:
 - Context: b"Birthmark" ensures domain separation
 """
 
+import hmac
+
 from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.kdf.hkdf import HKDF
 from cryptography.hazmat.backends import default_backend
@@ -93,7 +95,7 @@ def verify_key_derivation(
     """
     try:
         derived = derive_encryption_key(master_key, key_index, context)
-        return derived == expected_key
+        return hmac.compare_digest(derived, expected_key)
     except Exception:
         return False
 
@@ -20,6 +20,9 @@ from pathlib import Path
 from typing import List, Set, Optional
 from dataclasses import dataclass, asdict
 
+# Shared CSPRNG for table selection (avoids constructing one per assignment)
+_SYSRAND = secrets.SystemRandom()
+
 
 @dataclass
 class KeyTable:
@@ -115,11 +118,12 @@ class KeyTableManager:
         Raises:
             ValueError: If not enough tables available for assignment
         """
-        if exclude_tables is None:
-            exclude_tables = set()
-
-        # Available tables = all tables minus excluded ones
-        available_tables = set(range(self.total_tables)) - exclude_tables
+        # Available tables = all tables minus excluded ones. Without
+        # exclusions the range is sampled directly, never materialized.
+        if exclude_tables:
+            available_tables = sorted(set(range(self.total_tables)) - exclude_tables)
+        else:
+            available_tables = range(self.total_tables)
 
         if len(available_tables) < self.tables_per_device:
             raise ValueError(
@@ -127,18 +131,9 @@ class KeyTableManager:
                 f"have {len(available_tables)}"
             )
 
-        # Use secrets.choice for cryptographically secure random selection
-        assigned = []
-        available_list = list(available_tables)
-
-        for _ in range(self.tables_per_device):
-            # Pick random table
-            idx = secrets.randbelow(len(available_list))
-            table_id = available_list.pop(idx)
-            assigned.append(table_id)
-
-        # Sort for consistency (optional, makes debugging easier)
-        assigned.sort()
+        # Cryptographically secure selection without replacement, sorted for
+        # consistency (optional, makes debugging easier)
+        assigned = sorted(_SYSRAND.sample(available_tables, self.tables_per_device))
 
         # Track assignment
         self._assigned_tables[device_serial] = assigned
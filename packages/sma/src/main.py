@@ -100,7 +100,7 @@ class StatsResponse(BaseModel):
 app = FastAPI(
     title="Birthmark SMA (Simulated Manufacturer Authority)",
     description="Device provisioning and NUC token validation service",
-    version="0.1.0"
+    version="0.1.0",
 )
 
 # Add CORS middleware
@@ -813,13 +813,14 @@ async def validate_token_legacy(request: ValidationRequest):
                 message="Invalid ciphertext format (must be hex)"
             )
 
-        # Check table references are valid
-        for table_id in request.table_references:
-            if table_id not in table_manager.key_tables:
-                return ValidationResponse(
-                    valid=False,
-                    message=f"Invalid table reference: {table_id}"
-                )
+        # Check table references are valid (one set operation for all ids)
+        unknown_tables = set(request.table_references).difference(table_manager.key_tables)
+        if unknown_tables:
+            table_id = next(t for t in request.table_references if t in unknown_tables)
+            return ValidationResponse(
+                valid=False,
+                message=f"Invalid table reference: {table_id}"
+            )
 
         # Check key indices are in valid range (0-999)
         for key_idx in request.key_indices:
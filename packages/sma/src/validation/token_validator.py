@@ -11,6 +11,7 @@ NUC hash against registered devices.
 Privacy: The SMA never sees image hashes, only encrypted NUC tokens.
 """
 
+from functools import lru_cache
 from typing import Tuple, Optional
 from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 from cryptography.exceptions import InvalidTag
@@ -20,6 +21,18 @@ from ..key_tables.table_manager import KeyTableManager
 from ..identity.device_registry import DeviceRegistry, DeviceRegistration
 
 
+@lru_cache(maxsize=10_000)
+def _cached_encryption_key(master_key: bytes, key_index: int) -> bytes:
+    """
+    Derive (and memoize) the encryption key for a master key and key index.
+
+    Derived keys never change for a given (master_key, key_index), and cameras
+    reuse the same few table/index pairs, so repeat validations skip HKDF.
+    Keyed on the master key itself so regenerated tables cannot hit stale keys.
+    """
+    return derive_encryption_key(master_key, key_index)
+
+
 class TokenValidationResult:
     """
     Result of token validation.
@@ -111,7 +124,7 @@ class TokenValidator:
         # Step 3: Derive encryption key from master key
         try:
             master_key = self.table_manager.key_tables[table_id]
-            encryption_key = derive_encryption_key(master_key, key_index)
+            encryption_key = _cached_encryption_key(master_key, key_index)
         except Exception as e:
             return TokenValidationResult(
                 valid=False,
@@ -45,7 +45,7 @@ class ValidationCache:
             max_size: Maximum cached results (LRU eviction)
             ttl_seconds: Time-to-live for cached results (default 1 hour)
         """
-        self.cache: OrderedDict[str, CachedValidationResult] = OrderedDict()
+        self.cache: OrderedDict[bytes, CachedValidationResult] = OrderedDict()
         self.max_size = max_size
         self.ttl_seconds = ttl_seconds
 
@@ -60,7 +60,7 @@ class ValidationCache:
         nonce: str,
         table_id: int,
         key_index: int
-    ) -> str:
+    ) -> bytes:
         """
         Create cache key for token validation.
 
@@ -72,11 +72,16 @@ class ValidationCache:
             key_index: Key index within table
 
         Returns:
-            SHA-256 hash of request parameters
+            Raw SHA-256 digest of request parameters
         """
-        # Hash all parameters to create unique key
-        data = f"{ciphertext}:{auth_tag}:{nonce}:{table_id}:{key_index}"
-        return hashlib.sha256(data.encode()).hexdigest()
+        # Hash all parameters to create unique key (fed incrementally, no
+        # concatenated copy of the request)
+        h = hashlib.sha256()
+        for part in (ciphertext, auth_tag, nonce):
+            h.update(part.encode())
+            h.update(b":")
+        h.update(f"{table_id}:{key_index}".encode())
+        return h.digest()
 
     def _make_key_cert(
         self,
@@ -85,7 +90,7 @@ class ValidationCache:
         timestamp: int,
         gps_hash: Optional[str],
         bundle_signature: str
-    ) -> str:
+    ) -> bytes:
         """
         Create cache key for certificate validation.
 
@@ -97,11 +102,15 @@ class ValidationCache:
             bundle_signature: Base64-encoded signature
 
         Returns:
-            SHA-256 hash of request parameters
+            Raw SHA-256 digest of request parameters
         """
-        # Hash all parameters
-        data = f"{camera_cert}:{image_hash}:{timestamp}:{gps_hash or ''}:{bundle_signature}"
-        return hashlib.sha256(data.encode()).hexdigest()
+        # Hash all parameters; the certificate is by far the largest part,
+        # so it is fed to the hash directly rather than copied into a string
+        h = hashlib.sha256()
+        h.update(camera_cert.encode())
+        h.update(f":{image_hash}:{timestamp}:{gps_hash or ''}:".encode())
+        h.update(bundle_signature.encode())
+        return h.digest()
 
     def get_token_result(
         self,
@@ -135,7 +144,7 @@ class ValidationCache:
         key = self._make_key_cert(camera_cert, image_hash, timestamp, gps_hash, bundle_signature)
         return self._get(key)
 
-    def _get(self, key: str) -> Optional[CachedValidationResult]:
+    def _get(self, key: bytes) -> Optional[CachedValidationResult]:
         """Internal get with TTL check."""
         if key not in self.cache:
             self.misses += 1
@@ -187,7 +196,7 @@ class ValidationCache:
         key = self._make_key_cert(camera_cert, image_hash, timestamp, gps_hash, bundle_signature)
         self._put(key, valid, message, device_serial)
 
-    def _put(self, key: str, valid: bool, message: str, device_serial: Optional[str]):
+    def _put(self, key: bytes, valid: bool, message: str, device_serial: Optional[str]):
         """Internal put with LRU eviction."""
         # Evict oldest if at capacity
         if len(self.cache) >= self.max_size and key not in self.cache: